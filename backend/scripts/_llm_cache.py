@@ -0,0 +1,161 @@
+"""On-disk response cache for Gemini calls made by the generation scripts.
+
+Re-running quiz/summary generation during iteration re-hits the API for
+chapters whose content and prompt have not changed. This module caches raw
+model responses in a small SQLite database keyed by a SHA-256 of
+(model, temperature, prompt), so unchanged chapters return instantly.
+
+Responses are stored zlib-compressed to keep the database compact.
+"""
+
+import hashlib
+import sqlite3
+import time
+import zlib
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+# Single cache file shared by all generation scripts
+CACHE_DIR = Path.home() / ".cache" / "hackathon_llm"
+CACHE_DB = CACHE_DIR / "responses.db"
+
+# Embeddings live in their own database so clearing one cache doesn't
+# throw away the other
+EMBEDDINGS_DB = CACHE_DIR / "embeddings.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    created REAL NOT NULL,
+    response BLOB NOT NULL
+)
+"""
+
+
+def make_key(model_name: str, temperature: float, prompt: str) -> str:
+    """Build a cache key from the inputs that determine the response.
+
+    Args:
+        model_name: Gemini model identifier.
+        temperature: Generation temperature.
+        prompt: Full prompt text (including any static header).
+
+    Returns:
+        Hex SHA-256 digest usable as a cache key.
+    """
+    return hashlib.sha256(f"{model_name}|{temperature}|{prompt}".encode()).hexdigest()
+
+
+def make_embedding_key(model_name: str, text: str) -> str:
+    """Build a cache key for an embedding request.
+
+    Args:
+        model_name: Embedding model identifier (invalidates the entry
+            when the model changes).
+        text: Exact text being embedded.
+
+    Returns:
+        Hex SHA-256 digest usable as a cache key.
+    """
+    return hashlib.sha256(f"{model_name}:{text}".encode()).hexdigest()
+
+
+class LLMCache:
+    """SQLite-backed cache around async LLM calls."""
+
+    def __init__(
+        self,
+        db_path: Path = CACHE_DB,
+        ttl_days: float = 30,
+        enabled: bool = True,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            db_path: Location of the SQLite database file.
+            ttl_days: Entries older than this are treated as misses.
+            enabled: When False, every lookup misses and nothing is stored.
+        """
+        self.enabled = enabled
+        self.ttl_seconds = ttl_days * 86400
+        self._db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get or create the database connection."""
+        if self._conn is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._db_path)
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> str | None:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from make_key().
+
+        Returns:
+            The cached response text, or None on miss/expiry.
+        """
+        if not self.enabled:
+            return None
+
+        row = self._connection().execute(
+            "SELECT created, response FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        created, blob = row
+        if time.time() - created > self.ttl_seconds:
+            return None
+
+        return zlib.decompress(blob).decode("utf-8")
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key from make_key().
+            response: Raw response text to cache.
+        """
+        if not self.enabled:
+            return
+
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, created, response) VALUES (?, ?, ?)",
+            (key, time.time(), zlib.compress(response.encode("utf-8"))),
+        )
+        conn.commit()
+
+    async def get_or_set(
+        self,
+        key: str,
+        fetch_async: Callable[[], Awaitable[str]],
+    ) -> str:
+        """Return the cached response for key, calling fetch_async on miss.
+
+        Args:
+            key: Cache key from make_key().
+            fetch_async: Coroutine factory performing the actual LLM call.
+
+        Returns:
+            Cached or freshly fetched response text.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        response = await fetch_async()
+        self.set(key, response)
+        return response
+
+    def close(self) -> None:
+        """Close the database connection if open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
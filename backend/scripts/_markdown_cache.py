@@ -0,0 +1,59 @@
+"""On-disk cache of parsed markdown files.
+
+ingest_content and translate_content both run regex scans over the same
+source tree, and re-runs of either script re-parse files that haven't
+changed. This module memoizes parse results in-process and persists
+them as JSON keyed by the file's path, mtime and size, so an unchanged
+file is read and parsed at most once across script invocations.
+"""
+
+import hashlib
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Lives next to the LLM response caches
+CACHE_DIR = Path.home() / ".cache" / "hackathon_llm" / "markdown"
+
+# In-process layer: repeated lookups within one run don't touch disk
+_memory: dict[tuple, Any] = {}
+
+
+def _disk_key(kind: str, path: Path, mtime_ns: int, size: int) -> str:
+    """Content-addressed filename for a parse result."""
+    return hashlib.sha256(f"{kind}|{path}|{mtime_ns}|{size}".encode()).hexdigest()
+
+
+def parse_file(path: Path, kind: str, parse_fn: Callable[[str], Any]) -> Any:
+    """Parse a markdown file through the two-level cache.
+
+    The key is the file's stat signature (mtime + size), so cache hits
+    skip the file read as well as the parse. Stale entries are simply
+    orphaned when a file changes.
+
+    Args:
+        path: Markdown file to parse.
+        kind: Namespace for the result shape (ingest and translate
+            store different structures for the same file).
+        parse_fn: Called with the file's text on a miss; must return
+            something JSON-serializable. Tuples round-trip as lists.
+
+    Returns:
+        The cached or freshly computed parse result.
+    """
+    stat = path.stat()
+    memory_key = (kind, str(path), stat.st_mtime_ns, stat.st_size)
+    if memory_key in _memory:
+        return _memory[memory_key]
+
+    disk_path = CACHE_DIR / f"{_disk_key(kind, path, stat.st_mtime_ns, stat.st_size)}.json"
+    if disk_path.exists():
+        result = json.loads(disk_path.read_text(encoding="utf-8"))
+    else:
+        result = parse_fn(path.read_text(encoding="utf-8"))
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        disk_path.write_text(json.dumps(result), encoding="utf-8")
+
+    _memory[memory_key] = result
+    return result
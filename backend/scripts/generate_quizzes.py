@@ -11,13 +11,23 @@ Usage:
     python -m scripts.generate_quizzes [--chapter chapter-1] [--questions 5]
 """
 
+from __future__ import annotations
+
 import argparse
 import asyncio
+import concurrent.futures
+import datetime
+import hashlib
+import io
 import json
+import random
 import re
+import secrets
 import sys
 import uuid
+from collections.abc import Awaitable, Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -26,15 +36,30 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-import google.generativeai as genai
+import aiofiles
+import orjson
+import yaml
+from aiolimiter import AsyncLimiter
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
+try:
+    # libyaml-backed loader is much faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
+from scripts import _llm_cache
 from src.core.config import settings
 
 
-# Quiz generation prompt
-QUIZ_GENERATION_PROMPT = """You are an expert educator creating quiz questions for a humanoid robotics textbook.
+# Static quiz instructions. Kept separate from the per-chapter suffix so the
+# prefix is byte-identical across calls and eligible for Gemini context
+# caching (explicit CachedContent or implicit prefix caching).
+QUIZ_PROMPT_HEADER = """You are an expert educator creating quiz questions for a humanoid robotics textbook.
 
-Based on the following chapter content, generate {num_questions} quiz questions that test understanding of the key concepts.
+Based on the chapter content provided, generate the requested number of quiz questions that test understanding of the key concepts.
 
 REQUIREMENTS:
 1. Generate a mix of question types:
@@ -56,149 +81,437 @@ REQUIREMENTS:
    - A brief explanation of why the answer is correct
 
 OUTPUT FORMAT (JSON):
-{{
+{
   "title": "Chapter X Quiz",
   "description": "Test your understanding of [chapter topic]",
   "questions": [
-    {{
+    {
       "type": "multiple_choice",
       "question": "What is...?",
       "options": ["A. Option 1", "B. Option 2", "C. Option 3", "D. Option 4"],
       "correct_answer": "A",
       "explanation": "Option A is correct because..."
-    }},
-    {{
+    },
+    {
       "type": "true_false",
       "question": "Statement to evaluate",
       "options": ["True", "False"],
       "correct_answer": "True",
       "explanation": "This is true because..."
-    }},
-    {{
+    },
+    {
       "type": "short_answer",
       "question": "Explain briefly...",
       "options": null,
       "correct_answer": "Expected answer content",
       "explanation": "A complete answer should include..."
-    }}
+    }
   ]
-}}
+}
+"""
 
-CHAPTER CONTENT:
+# Per-chapter suffix: only the variable parts go here, after the static
+# header, so the cacheable prefix never changes between chapters.
+QUIZ_PROMPT_SUFFIX = """CHAPTER CONTENT:
 {content}
 
 Generate {num_questions} high-quality quiz questions now. Respond ONLY with valid JSON.
 """
 
+# Markdown-cleanup patterns, compiled once at import so the per-chapter
+# hot path skips the re-module cache lookups. All element patterns are
+# fused into one alternation so cleaning scans the chapter once instead
+# of allocating a fresh 30 KB+ string per pattern; the image alternative
+# precedes the link one so `![...](...)` is not half-matched as a link.
+_RE_MARKDOWN_ELEMENT = re.compile(
+    r'(?P<code>```[\s\S]*?```)'
+    r'|(?P<inline>`[^`]+`)'
+    r'|(?P<image>!\[.*?\]\(.*?\))'
+    r'|(?P<link>\[(?P<text>[^\]]+)\]\([^)]+\))'
+)
+_RE_EXTRA_NEWLINES = re.compile(r'\n{3,}')
+
+
+def _replace_markdown_element(match: re.Match) -> str:
+    """Dispatch replacement for one fused-pattern match."""
+    if match.group('code'):
+        return '[CODE EXAMPLE]'
+    if match.group('link'):
+        return match.group('text')
+    # Inline code and images are dropped entirely
+    return ''
+
 
 def extract_text_content(markdown: str) -> str:
     """Extract readable text from markdown, removing code blocks.
 
+    Callers are expected to strip frontmatter first via
+    extract_frontmatter; this function no longer re-scans for it.
+
     Args:
-        markdown: Raw markdown content
+        markdown: Markdown body (frontmatter already removed)
 
     Returns:
         Cleaned text content
     """
-    # Remove frontmatter
-    if markdown.startswith("---"):
-        parts = markdown.split("---", 2)
-        if len(parts) >= 3:
-            markdown = parts[2]
+    # Remove code blocks, inline code and images; unwrap links (one pass)
+    markdown = _RE_MARKDOWN_ELEMENT.sub(_replace_markdown_element, markdown)
 
-    # Remove code blocks
-    markdown = re.sub(r'```[\s\S]*?```', '[CODE EXAMPLE]', markdown)
+    # Clean up excessive whitespace (separate pass: operates on the
+    # gaps the element removal leaves behind)
+    markdown = _RE_EXTRA_NEWLINES.sub('\n\n', markdown)
 
-    # Remove inline code
-    markdown = re.sub(r'`[^`]+`', '', markdown)
+    return markdown.strip()
 
-    # Remove images
-    markdown = re.sub(r'!\[.*?\]\(.*?\)', '', markdown)
 
-    # Remove links but keep text
-    markdown = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', markdown)
+def find_json_object(s: str) -> str | None:
+    """Find the first complete JSON object in a string.
 
-    # Clean up excessive whitespace
-    markdown = re.sub(r'\n{3,}', '\n\n', markdown)
+    Single-pass brace-depth scanner that tracks string literals and
+    backslash escapes, so nested braces are matched correctly and
+    markdown fences or trailing prose around the object are ignored —
+    without the O(N) re-scans of chained split() calls or the
+    backtracking of a greedy regex.
 
-    return markdown.strip()
+    Args:
+        s: Text possibly containing a JSON object
+
+    Returns:
+        The substring from the first '{' to its matching '}', or None
+    """
+    start = s.find('{')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i in range(start, len(s)):
+        char = s[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return s[start:i + 1]
+
+    return None
 
 
 def extract_frontmatter(content: str) -> tuple[dict, str]:
     """Extract YAML frontmatter from markdown.
 
+    Locates the closing delimiter with two str.find-style index lookups
+    instead of regex/split scans, and parses the slice with YAML so
+    multi-line values are handled correctly.
+
     Args:
         content: Raw markdown content
 
     Returns:
         Tuple of (frontmatter dict, remaining content)
     """
-    frontmatter = {}
+    if not content.startswith("---\n"):
+        return {}, content
+
+    end = content.find("\n---\n", 4)
+    if end == -1:
+        return {}, content
 
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            for line in parts[1].strip().split("\n"):
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    frontmatter[key.strip()] = value.strip()
-            content = parts[2]
+    try:
+        frontmatter = yaml.load(content[4:end], Loader=_YamlLoader)
+    except yaml.YAMLError:
+        frontmatter = None
 
-    return frontmatter, content
+    if not isinstance(frontmatter, dict):
+        frontmatter = {}
 
+    return frontmatter, content[end + 5:]
 
-async def generate_quiz_for_chapter(
-    chapter_path: Path,
-    num_questions: int,
+
+async def retry_with_backoff(
+    fetch_async: "Callable[[], Awaitable[str]]",
+    max_attempts: int = 5,
+) -> str:
+    """Call fetch_async, retrying transient Gemini failures.
+
+    Exponential backoff with full jitter (1s base, 30s cap), so a
+    transient 429/503 recovers inside the run instead of forcing a full
+    re-run of the script. Non-transient errors surface immediately.
+
+    Args:
+        fetch_async: Coroutine factory performing the API call
+        max_attempts: Total attempts before giving up
+
+    Returns:
+        The fetched response text
+
+    Raises:
+        The last transient error if all attempts fail, or any
+        non-transient error immediately
+    """
+    from google.api_core import exceptions as api_exceptions
+
+    transient = (
+        api_exceptions.ResourceExhausted,
+        api_exceptions.ServiceUnavailable,
+        api_exceptions.DeadlineExceeded,
+        api_exceptions.InternalServerError,
+    )
+
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await fetch_async()
+        except transient as e:
+            if attempt == max_attempts:
+                raise
+            delay = min(2 ** (attempt - 1), 30) * random.uniform(0.5, 1.0)
+            print(
+                f"  - Transient API error ({type(e).__name__}), "
+                f"retrying in {delay:.1f}s (attempt {attempt}/{max_attempts})"
+            )
+            await asyncio.sleep(delay)
+
+    raise RuntimeError("unreachable")  # pragma: no cover
+
+
+# Token budget for chapter text within the prompt (leaves headroom for
+# the instruction header and the generated output)
+MAX_CONTENT_TOKENS = 8000
+
+TRUNCATION_MARKER = "\n\n[Content truncated...]"
+
+
+async def truncate_to_tokens(
+    text: str,
     model: genai.GenerativeModel,
-) -> dict | None:
-    """Generate quiz questions for a chapter using Gemini.
+    max_tokens: int,
+    cache: _llm_cache.LLMCache,
+) -> str:
+    """Truncate text to a token budget using the model's tokenizer.
+
+    Measures with count_tokens and shrinks proportionally until the text
+    fits, which is precise where the old 30 000-character slice either
+    wasted context on char-dense text or overflowed it on multi-byte
+    text. The computed cut index is cached by content hash since
+    count_tokens is itself an API round-trip. Falls back to a character
+    heuristic when token counting is unavailable.
 
     Args:
-        chapter_path: Path to chapter markdown file
-        num_questions: Number of questions to generate
-        model: Gemini model instance
+        text: Cleaned chapter text
+        model: Gemini model used for counting
+        max_tokens: Maximum tokens the text may occupy
+        cache: On-disk cache for the computed cut index
 
     Returns:
-        Quiz data dict or None on error
+        Text fitting within max_tokens, with a truncation marker if cut
     """
-    print(f"Processing: {chapter_path.name}")
+    cache_key = _llm_cache.make_key(
+        settings.generation_model,
+        float(max_tokens),
+        "token-truncate|" + hashlib.sha256(text.encode()).hexdigest(),
+    )
 
-    # Read content
-    content = chapter_path.read_text(encoding='utf-8')
+    cached_cut = cache.get(cache_key)
+    if cached_cut is not None:
+        cut = int(cached_cut)
+        return text if cut >= len(text) else text[:cut] + TRUNCATION_MARKER
+
+    try:
+        total = (await model.count_tokens_async(text)).total_tokens
+        cut = len(text)
+        while total > max_tokens:
+            # Proportional shrink with a 5% safety margin, re-measured
+            # until the slice fits (usually one extra round-trip)
+            cut = int(cut * max_tokens / total * 0.95)
+            total = (await model.count_tokens_async(text[:cut])).total_tokens
+    except Exception as e:
+        print(f"  - Token counting unavailable ({e}), using character heuristic")
+        # ~4 chars per token on English prose
+        cut = min(len(text), max_tokens * 4)
+
+    cache.set(cache_key, str(cut))
+    return text if cut >= len(text) else text[:cut] + TRUNCATION_MARKER
+
+
+def preprocess_chapter(chapter_path: Path) -> tuple[str, str, str]:
+    """Read and clean one chapter file for quiz generation.
+
+    Pure CPU + disk work, so it can run in a worker process off the
+    event loop and in parallel across cores.
+
+    Args:
+        chapter_path: Path to chapter markdown file
+
+    Returns:
+        Tuple of (chapter_id, title, cleaned text content)
+    """
+    # read_bytes + one-shot decode skips TextIOWrapper's chunked decoding
+    # and newline translation, which the regex cleanup doesn't need
+    content = chapter_path.read_bytes().decode('utf-8')
     frontmatter, body = extract_frontmatter(content)
 
-    # Extract chapter info
     chapter_id = chapter_path.parent.name
     title = frontmatter.get("title", chapter_id.replace("-", " ").title())
-
-    # Clean content for quiz generation
     text_content = extract_text_content(body)
 
-    # Truncate if too long (Gemini has context limits)
-    max_chars = 30000
-    if len(text_content) > max_chars:
-        text_content = text_content[:max_chars] + "\n\n[Content truncated...]"
+    return chapter_id, title, text_content
+
+
+def create_quiz_model() -> genai.GenerativeModel:
+    """Create the Gemini model for quiz generation.
+
+    Tries to register the static instruction header as explicit cached
+    content so it is billed at the cached-token rate instead of being
+    re-sent with every chapter. Falls back to a plain model (with the
+    header as system instruction, still benefiting from implicit prefix
+    caching) when explicit caching is unavailable, e.g. because the
+    prefix is below the model's minimum cacheable token count.
+
+    Returns:
+        Configured GenerativeModel instance
+    """
+    import google.generativeai as genai
+
+    generation_config = genai.GenerationConfig(
+        temperature=0.7,  # Some creativity for varied questions
+        top_p=0.9,
+    )
+
+    # The prompt hash in the display name invalidates stale caches:
+    # editing the header yields a new name, so old entries are ignored.
+    prompt_hash = hashlib.sha256(QUIZ_PROMPT_HEADER.encode()).hexdigest()[:12]
+    display_name = f"quiz-prompt-{prompt_hash}"
+
+    try:
+        cached = None
+        for existing in genai.caching.CachedContent.list():
+            if existing.display_name == display_name:
+                cached = existing
+                break
+
+        if cached is None:
+            cached = genai.caching.CachedContent.create(
+                model=settings.generation_model,
+                display_name=display_name,
+                system_instruction=QUIZ_PROMPT_HEADER,
+                ttl=datetime.timedelta(hours=1),
+            )
+
+        print(f"Using cached prompt prefix: {display_name}")
+        return genai.GenerativeModel.from_cached_content(
+            cached,
+            generation_config=generation_config,
+        )
+    except Exception as e:
+        print(f"Context caching unavailable ({e}), sending prompt inline")
+        return genai.GenerativeModel(
+            model_name=settings.generation_model,
+            generation_config=generation_config,
+            system_instruction=QUIZ_PROMPT_HEADER,
+        )
+
+
+async def generate_quiz_for_chapter(
+    chapter_id: str,
+    title: str,
+    text_content: str,
+    num_questions: int,
+    model: genai.GenerativeModel,
+    cache: _llm_cache.LLMCache,
+    limiter: AsyncLimiter,
+) -> dict | None:
+    """Generate quiz questions for a chapter using Gemini.
+
+    Args:
+        chapter_id: Chapter identifier (directory name)
+        title: Chapter title
+        text_content: Cleaned chapter text from preprocess_chapter
+        num_questions: Number of questions to generate
+        model: Gemini model instance (static instructions already attached)
+        cache: On-disk response cache
+        limiter: Token-bucket rate limiter shared across chapters
+
+    Returns:
+        Quiz data dict or None on error
+    """
+    print(f"Processing: {chapter_id}")
+
+    # Truncate precisely by token count (Gemini has context limits)
+    text_content = await truncate_to_tokens(
+        text_content, model, MAX_CONTENT_TOKENS, cache
+    )
 
     print(f"  - Content length: {len(text_content)} chars")
 
-    # Generate quiz using Gemini
-    prompt = QUIZ_GENERATION_PROMPT.format(
+    # Only the variable suffix is sent per call; the static instructions
+    # live on the model (cached content or system instruction)
+    prompt = QUIZ_PROMPT_SUFFIX.format(
         num_questions=num_questions,
         content=text_content
     )
 
-    try:
-        response = await model.generate_content_async(prompt)
-        response_text = response.text
+    # Cache key covers the static header too, so editing the
+    # instructions invalidates prior responses
+    cache_key = _llm_cache.make_key(
+        settings.generation_model, 0.7, QUIZ_PROMPT_HEADER + prompt
+    )
 
-        # Extract JSON from response (handle markdown code blocks)
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0]
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0]
+    async def fetch() -> str:
+        # Stream the response so network transfer overlaps accumulation
+        # instead of blocking until the full quiz JSON is produced.
+        # The limiter is taken per real API call, so cache hits are free.
+        async with limiter:
+            try:
+                buffer = io.StringIO()
+                stream = await model.generate_content_async(prompt, stream=True)
+                async for chunk in stream:
+                    buffer.write(chunk.text)
+                return buffer.getvalue()
+            except Exception as e:
+                print(f"  - Streaming failed ({e}), retrying without stream")
+                response = await model.generate_content_async(prompt)
+                return response.text
 
-        quiz_data = json.loads(response_text.strip())
+    try:
+        response_text = await cache.get_or_set(
+            cache_key, lambda: retry_with_backoff(fetch)
+        )
+
+        try:
+            quiz_data = parse_quiz_json(response_text)
+        except json.JSONDecodeError as e:
+            # Malformed output takes a different retry path: one
+            # deterministic re-generation at lower temperature,
+            # bypassing the cache so the bad response isn't reused
+            print(f"  - Error parsing JSON ({e}), retrying at temperature 0.2")
+
+            async def fetch_strict() -> str:
+                import google.generativeai as genai
+
+                async with limiter:
+                    response = await model.generate_content_async(
+                        prompt,
+                        generation_config=genai.GenerationConfig(
+                            temperature=0.2,
+                            top_p=0.9,
+                        ),
+                    )
+                return response.text
+
+            response_text = await retry_with_backoff(fetch_strict)
+            quiz_data = parse_quiz_json(response_text)
+            cache.set(cache_key, response_text)
 
         # Add metadata
         quiz_data["chapter_id"] = chapter_id
@@ -216,9 +529,148 @@ async def generate_quiz_for_chapter(
         return None
 
 
-def save_quiz(quiz_data: dict, output_dir: Path) -> Path:
+# Suffix for batch mode: all chapters ride in one request, amortizing
+# the static instruction tokens and the per-call network round-trip
+BATCH_PROMPT_SUFFIX = """CHAPTER CONTENTS (multiple chapters, each introduced by "### <chapter_id>"):
+{content}
+
+Generate {num_questions} high-quality quiz questions per chapter. Respond ONLY with a valid JSON array containing one quiz object per chapter, each with an additional "chapter_id" field matching the chapter it was generated from.
+"""
+
+# Conservative ceiling for a single batched request
+MAX_BATCH_TOKENS = 100000
+
+
+async def generate_quizzes_batched(
+    preprocessed: list[tuple[str, str, str]],
+    num_questions: int,
+    model: genai.GenerativeModel,
+    cache: _llm_cache.LLMCache,
+    limiter: AsyncLimiter,
+) -> list[dict] | None:
+    """Generate quizzes for all chapters in a single Gemini call.
+
+    Packs every chapter's cleaned text into one request and asks for a
+    JSON array of quiz objects keyed by chapter_id, saving the fixed
+    prompt overhead and N-1 network round-trips.
+
+    Args:
+        preprocessed: (chapter_id, title, text) tuples from preprocess_chapter
+        num_questions: Number of questions per chapter
+        model: Gemini model instance (static instructions already attached)
+        cache: On-disk response cache
+
+    Returns:
+        List of quiz data dicts, or None if the batch doesn't fit or fails
+        (callers should fall back to per-chapter generation)
+    """
+    import google.generativeai as genai
+
+    titles = {chapter_id: title for chapter_id, title, _ in preprocessed}
+    combined = "\n\n".join(
+        f"### {chapter_id}\n{text}" for chapter_id, _, text in preprocessed
+    )
+
+    prompt = BATCH_PROMPT_SUFFIX.format(
+        num_questions=num_questions,
+        content=combined,
+    )
+
+    try:
+        total = (await model.count_tokens_async(prompt)).total_tokens
+        if total > MAX_BATCH_TOKENS:
+            print(f"Batch too large ({total} tokens), falling back to per-chapter")
+            return None
+    except Exception as e:
+        print(f"  - Token counting unavailable ({e}), attempting batch anyway")
+
+    cache_key = _llm_cache.make_key(
+        settings.generation_model, 0.7, QUIZ_PROMPT_HEADER + prompt
+    )
+
+    async def fetch() -> str:
+        async with limiter:
+            response = await model.generate_content_async(
+                prompt,
+                generation_config=genai.GenerationConfig(
+                    temperature=0.7,
+                    top_p=0.9,
+                    response_mime_type="application/json",
+                ),
+            )
+        return response.text
+
+    try:
+        response_text = await cache.get_or_set(
+            cache_key, lambda: retry_with_backoff(fetch)
+        )
+        quizzes = orjson.loads(response_text.strip())
+    except Exception as e:
+        print(f"Batched generation failed ({e}), falling back to per-chapter")
+        return None
+
+    if not isinstance(quizzes, list):
+        print("Batched response was not a JSON array, falling back to per-chapter")
+        return None
+
+    results = []
+    for quiz_data in quizzes:
+        chapter_id = quiz_data.get("chapter_id")
+        if chapter_id not in titles:
+            print(f"  - Skipping quiz for unknown chapter_id: {chapter_id}")
+            continue
+        quiz_data["chapter_title"] = titles[chapter_id]
+        print(f"  - {chapter_id}: {len(quiz_data.get('questions', []))} questions")
+        results.append(quiz_data)
+
+    return results
+
+
+def parse_quiz_json(response_text: str) -> dict:
+    """Parse quiz JSON out of a raw model response.
+
+    Args:
+        response_text: Raw response text
+
+    Returns:
+        Parsed quiz dict
+
+    Raises:
+        json.JSONDecodeError: If no valid JSON object can be parsed
+    """
+    json_text = find_json_object(response_text) or response_text.strip()
+    try:
+        return orjson.loads(json_text)
+    except orjson.JSONDecodeError:
+        # stdlib json is slower but slightly more permissive with
+        # Gemini's occasionally malformed output
+        return json.loads(json_text)
+
+
+def dedupe_cache_path(output_dir: Path, text_content: str) -> Path:
+    """Content-addressed path for a generated quiz.
+
+    Keyed by the cleaned chapter text plus the prompt header, so two
+    chapter files with identical content (e.g. a copied index.md during
+    refactors) share one generated quiz instead of both hitting Gemini.
+
+    Args:
+        output_dir: Quiz output directory
+        text_content: Cleaned chapter text
+
+    Returns:
+        Path under output_dir/.cache for this content
+    """
+    key = hashlib.sha256((QUIZ_PROMPT_HEADER + text_content).encode()).hexdigest()
+    return output_dir / ".cache" / f"{key}.json"
+
+
+async def save_quiz(quiz_data: dict, output_dir: Path) -> Path:
     """Save quiz data to JSON file.
 
+    Writes through aiofiles so the disk write doesn't block the event
+    loop while other chapters' API calls are in flight.
+
     Args:
         quiz_data: Quiz data dictionary
         output_dir: Directory to save quiz files
@@ -229,19 +681,24 @@ def save_quiz(quiz_data: dict, output_dir: Path) -> Path:
     chapter_id = quiz_data.get("chapter_id", "unknown")
     output_path = output_dir / f"{chapter_id}-quiz.json"
 
+    questions = quiz_data.get("questions", [])
+
+    # Draw entropy for all IDs in one syscall instead of one
+    # /dev/urandom read per uuid4() call
+    rand = secrets.token_bytes(16 * (len(questions) + 1))
+
     # Add UUIDs to questions
-    for i, question in enumerate(quiz_data.get("questions", [])):
-        question["id"] = str(uuid.uuid4())
+    for i, question in enumerate(questions):
+        question["id"] = str(uuid.UUID(bytes=rand[i * 16:(i + 1) * 16], version=4))
         question["order"] = i + 1
         question["points"] = 1
 
     # Add quiz UUID
-    quiz_data["id"] = str(uuid.uuid4())
+    quiz_data["id"] = str(uuid.UUID(bytes=rand[-16:], version=4))
 
-    output_path.write_text(
-        json.dumps(quiz_data, indent=2, ensure_ascii=False),
-        encoding='utf-8'
-    )
+    # orjson emits UTF-8 bytes directly (no ensure_ascii escaping pass)
+    async with aiofiles.open(output_path, "wb") as f:
+        await f.write(orjson.dumps(quiz_data, option=orjson.OPT_INDENT_2))
 
     return output_path
 
@@ -259,6 +716,12 @@ async def main():
         default=5,
         help="Number of questions per quiz (default: 5)"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of chapters processed in parallel (default: 4)"
+    )
     parser.add_argument(
         "--content-dir",
         default="content/source",
@@ -269,6 +732,23 @@ async def main():
         default="content/quizzes",
         help="Directory for output quiz files"
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Pack all chapters into a single Gemini call (falls back to "
+             "per-chapter generation if the batch doesn't fit)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk response cache and always call Gemini"
+    )
+    parser.add_argument(
+        "--ttl-days",
+        type=float,
+        default=30,
+        help="Maximum age of cached responses in days (default: 30)"
+    )
 
     args = parser.parse_args()
 
@@ -277,16 +757,14 @@ async def main():
         print("Error: GEMINI_API_KEY not set in environment")
         sys.exit(1)
 
+    # Imported here (not at module top) so --help, argument errors and
+    # the no-chapters paths don't pay the ~500ms grpc/protobuf import
+    import google.generativeai as genai
+
     genai.configure(api_key=settings.gemini_api_key)
 
-    # Create model with appropriate settings
-    model = genai.GenerativeModel(
-        model_name=settings.generation_model,
-        generation_config=genai.GenerationConfig(
-            temperature=0.7,  # Some creativity for varied questions
-            top_p=0.9,
-        ),
-    )
+    # Create model with the static instructions attached (cached if possible)
+    model = create_quiz_model()
 
     # Find content directory
     content_dir = Path(args.content_dir)
@@ -319,23 +797,89 @@ async def main():
         sys.exit(1)
 
     print(f"Found {len(md_files)} chapter(s) to process")
+    print(f"Concurrency: {args.concurrency}")
 
-    # Generate quizzes
-    generated = 0
-    for chapter_path in md_files:
-        quiz_data = await generate_quiz_for_chapter(
-            chapter_path,
-            args.questions,
-            model
+    # Preprocess (read + regex cleanup) in worker processes so disk I/O
+    # and CPU work run across cores instead of blocking the event loop
+    with concurrent.futures.ProcessPoolExecutor() as pool:
+        preprocessed = list(pool.map(preprocess_chapter, md_files))
+
+    cache = _llm_cache.LLMCache(ttl_days=args.ttl_days, enabled=not args.no_cache)
+
+    # Token-bucket limiter: issues calls at exactly the allowed rate
+    # instead of the fixed 2s sleep that over-waited near the end of a
+    # run and under-used quota at the start
+    limiter = AsyncLimiter(settings.gemini_rpm, 60)
+
+    # Batch mode: one request for all chapters, amortizing prompt overhead
+    if args.batch and len(preprocessed) > 1:
+        batched = await generate_quizzes_batched(
+            preprocessed, args.questions, model, cache, limiter
         )
+        if batched is not None:
+            generated = 0
+            for quiz_data in batched:
+                output_path = await save_quiz(quiz_data, output_dir)
+                print(f"  - Saved to: {output_path}")
+                generated += 1
+            cache.close()
+            print(f"\nQuiz generation complete! Generated {generated} quiz(es).")
+            return
+
+    # Generate quizzes concurrently, bounded by a semaphore so we don't
+    # exceed the Gemini rate limit
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def process(chapter_id: str, title: str, text_content: str) -> Path | None:
+        # Reuse output generated for identical cleaned text (another
+        # chapter file or a previous run) without calling the API
+        dedupe_path = dedupe_cache_path(output_dir, text_content)
+        if dedupe_path.exists():
+            print(f"Processing: {chapter_id}")
+            print("  - Reusing quiz generated for identical content")
+            quiz_data = orjson.loads(dedupe_path.read_bytes())
+            quiz_data["chapter_id"] = chapter_id
+            quiz_data["chapter_title"] = title
+        else:
+            async with semaphore:
+                quiz_data = await generate_quiz_for_chapter(
+                    chapter_id,
+                    title,
+                    text_content,
+                    args.questions,
+                    model,
+                    cache,
+                    limiter,
+                )
+
+            if quiz_data is not None:
+                # Store before save_quiz injects per-chapter IDs, so a
+                # reusing chapter gets fresh IDs of its own
+                dedupe_path.parent.mkdir(parents=True, exist_ok=True)
+                dedupe_path.write_bytes(orjson.dumps(quiz_data))
+
+        if quiz_data is None:
+            return None
+
+        # Save inside the task so the full per-chapter pipeline
+        # (preprocess -> LLM -> save) overlaps across chapters
+        output_path = await save_quiz(quiz_data, output_dir)
+        print(f"  - Saved to: {output_path}")
+        return output_path
+
+    results = await asyncio.gather(
+        *[process(*chapter) for chapter in preprocessed],
+        return_exceptions=True,
+    )
 
-        if quiz_data:
-            output_path = save_quiz(quiz_data, output_dir)
-            print(f"  - Saved to: {output_path}")
+    generated = 0
+    for (chapter_id, _, _), result in zip(preprocessed, results):
+        if isinstance(result, BaseException):
+            print(f"  - Failed {chapter_id}: {result}")
+        elif result is not None:
             generated += 1
 
-        # Rate limiting
-        await asyncio.sleep(2)
+    cache.close()
 
     print(f"\nQuiz generation complete! Generated {generated} quiz(es).")
 
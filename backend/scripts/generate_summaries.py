@@ -8,40 +8,66 @@ Usage:
     python -m scripts.generate_summaries [--chapter CHAPTER_ID]
 """
 
+from __future__ import annotations
+
 import argparse
 import asyncio
+import functools
 import json
 import re
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.core.gemini import GeminiClient
+import orjson
+from aiolimiter import AsyncLimiter
+
+from scripts import _llm_cache
+from scripts.generate_quizzes import (
+    extract_frontmatter,
+    find_json_object,
+    retry_with_backoff,
+    truncate_to_tokens,
+)
+from src.core.config import settings
+
+if TYPE_CHECKING:
+    from src.core.gemini import GeminiClient
 
 
 # Configuration
 CONTENT_DIR = Path(__file__).parent.parent.parent / "content" / "source"
 OUTPUT_DIR = Path(__file__).parent.parent.parent / "content" / "summaries"
 
-# Chapter metadata
-CHAPTERS = {
-    "chapter-1": {
-        "title": "Introduction to Humanoid Robotics",
-        "file": "chapter-1/index.md",
-    },
-    "chapter-2": {
-        "title": "Robot Components and Architecture",
-        "file": "chapter-2/index.md",
-    },
-    "chapter-3": {
-        "title": "Sensors and Actuators",
-        "file": "chapter-3/index.md",
-    },
-}
+# Token budget for chapter text within the summary prompt
+MAX_CONTENT_TOKENS = 4000
+
+
+@functools.lru_cache(maxsize=1)
+def discover_chapters() -> dict[str, Path]:
+    """Discover chapter files under the content directory.
+
+    Replaces the old hardcoded CHAPTERS dict (a second source of truth
+    that had to be edited for every new chapter). Cached for the
+    process lifetime so repeated lookups don't re-glob the tree or
+    re-stat files.
+
+    Returns:
+        Mapping of chapter_id to its index.md path, in chapter order.
+    """
+    return {
+        path.parent.name: path
+        for path in sorted(CONTENT_DIR.glob("chapter-*/index.md"))
+    }
+
 
-SUMMARY_PROMPT = """You are an expert educational content summarizer specializing in robotics and engineering.
+# Static summarization instructions. Kept separate from the per-chapter
+# suffix so the prefix is byte-identical across calls and eligible for
+# Gemini prefix caching; passed as the system instruction.
+SUMMARY_PROMPT_HEADER = """You are an expert educational content summarizer specializing in robotics and engineering.
 
 Analyze the following chapter from a humanoid robotics textbook and generate a comprehensive summary.
 
@@ -64,42 +90,49 @@ Format your response as JSON with this structure:
         "Important takeaway 2"
     ]
 }
+"""
 
-Chapter Title: {title}
+# Per-chapter suffix: only the variable parts go here, after the static
+# header, so the cacheable prefix never changes between chapters.
+SUMMARY_PROMPT_SUFFIX = """Chapter Title: {title}
 
 Chapter Content:
 {content}
 
 Generate the summary JSON:"""
 
+# Patterns compiled once at import so per-chapter calls skip the
+# re-module cache lookups
+_RE_CODE_BLOCK = re.compile(r"```[\s\S]*?```")
 
-def read_chapter_content(chapter_id: str) -> str | None:
-    """Read chapter markdown content.
+
+def read_chapter_content(chapter_id: str) -> tuple[str, str] | None:
+    """Read chapter title and markdown content.
 
     Args:
         chapter_id: Chapter identifier (e.g., "chapter-1").
 
     Returns:
-        Chapter content as string, or None if not found.
+        Tuple of (title, cleaned content), or None if not found.
     """
-    if chapter_id not in CHAPTERS:
+    chapters = discover_chapters()
+    if chapter_id not in chapters:
         print(f"Unknown chapter: {chapter_id}")
         return None
 
-    file_path = CONTENT_DIR / CHAPTERS[chapter_id]["file"]
-    if not file_path.exists():
-        print(f"Chapter file not found: {file_path}")
-        return None
+    # read_bytes + one-shot decode skips TextIOWrapper's chunked decoding
+    # and newline translation, which the cleanup below doesn't need
+    content = chapters[chapter_id].read_bytes().decode("utf-8")
 
-    content = file_path.read_text(encoding="utf-8")
-
-    # Remove frontmatter
-    content = re.sub(r"^---\n.*?\n---\n", "", content, flags=re.DOTALL)
+    # Split frontmatter off (index-based split, no regex scan) and take
+    # the title from it instead of a hardcoded table
+    frontmatter, content = extract_frontmatter(content)
+    title = frontmatter.get("title", chapter_id.replace("-", " ").title())
 
     # Remove code blocks for summary generation (keep focus on concepts)
-    content = re.sub(r"```[\s\S]*?```", "[code example]", content)
+    content = _RE_CODE_BLOCK.sub("[code example]", content)
 
-    return content.strip()
+    return title, content.strip()
 
 
 def extract_json_from_response(response: str) -> dict | None:
@@ -111,46 +144,73 @@ def extract_json_from_response(response: str) -> dict | None:
     Returns:
         Parsed JSON dict or None if parsing fails.
     """
-    # Try to find JSON block
-    json_match = re.search(r"```json\s*([\s\S]*?)\s*```", response)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        # Try to find raw JSON
-        json_match = re.search(r"\{[\s\S]*\}", response)
-        if json_match:
-            json_str = json_match.group(0)
-        else:
-            return None
+    # Single-pass brace-depth scan; markdown fences and surrounding
+    # prose fall away automatically
+    json_str = find_json_object(response)
+    if json_str is None:
+        return None
 
     try:
-        return json.loads(json_str)
-    except json.JSONDecodeError as e:
-        print(f"JSON parse error: {e}")
-        return None
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError:
+        # stdlib json is slower but slightly more permissive with
+        # Gemini's occasionally malformed output
+        try:
+            return json.loads(json_str)
+        except json.JSONDecodeError as e:
+            print(f"JSON parse error: {e}")
+            return None
 
 
-async def generate_summary(chapter_id: str, client: GeminiClient) -> dict | None:
+async def generate_summary(
+    chapter_id: str,
+    client: GeminiClient,
+    cache: _llm_cache.LLMCache,
+    limiter: AsyncLimiter,
+) -> dict | None:
     """Generate summary for a chapter using Gemini.
 
     Args:
         chapter_id: Chapter identifier.
         client: Gemini client instance.
+        cache: On-disk response cache.
+        limiter: Token-bucket rate limiter shared across chapters.
 
     Returns:
         Summary dict or None if generation fails.
     """
-    content = read_chapter_content(chapter_id)
-    if not content:
+    chapter = read_chapter_content(chapter_id)
+    if not chapter:
         return None
 
-    title = CHAPTERS[chapter_id]["title"]
-    prompt = SUMMARY_PROMPT.format(title=title, content=content[:15000])  # Limit content length
+    title, content = chapter
+
+    # Truncate precisely by token count instead of a character slice
+    content = await truncate_to_tokens(
+        content, client.generation_model, MAX_CONTENT_TOKENS, cache
+    )
+    prompt = SUMMARY_PROMPT_SUFFIX.format(title=title, content=content)
 
     print(f"Generating summary for {chapter_id}...")
 
+    cache_key = _llm_cache.make_key(
+        settings.generation_model,
+        settings.generation_temperature,
+        SUMMARY_PROMPT_HEADER + prompt,
+    )
+
+    async def fetch() -> str:
+        # The limiter is taken per real API call, so cache hits are free
+        async with limiter:
+            return await client.generate_text(
+                prompt,
+                system_instruction=SUMMARY_PROMPT_HEADER,
+            )
+
     try:
-        response = await client.generate_text(prompt)
+        response = await cache.get_or_set(
+            cache_key, lambda: retry_with_backoff(fetch)
+        )
         summary = extract_json_from_response(response)
 
         if summary:
@@ -176,8 +236,8 @@ def save_summary(summary: dict, chapter_id: str) -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     output_path = OUTPUT_DIR / f"{chapter_id}-summary.json"
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    # orjson emits UTF-8 bytes directly (no ensure_ascii escaping pass)
+    output_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
 
     print(f"Saved summary to {output_path}")
 
@@ -190,27 +250,68 @@ async def main() -> None:
         type=str,
         help="Generate summary for specific chapter (e.g., chapter-1)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of chapters processed in parallel (default: 4)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk response cache and always call Gemini",
+    )
+    parser.add_argument(
+        "--ttl-days",
+        type=float,
+        default=30,
+        help="Maximum age of cached responses in days (default: 30)",
+    )
     args = parser.parse_args()
 
+    # Imported here (not at module top) so --help and argument errors
+    # don't pay the Gemini SDK's grpc/protobuf import cost
+    from src.core.gemini import GeminiClient
+
     client = GeminiClient()
+    cache = _llm_cache.LLMCache(ttl_days=args.ttl_days, enabled=not args.no_cache)
+
+    # Token-bucket limiter: issues calls at exactly the allowed rate
+    # instead of the fixed 1s sleep between chapters
+    limiter = AsyncLimiter(settings.gemini_rpm, 60)
 
     if args.chapter:
         # Generate for specific chapter
-        if args.chapter not in CHAPTERS:
+        if args.chapter not in discover_chapters():
             print(f"Unknown chapter: {args.chapter}")
-            print(f"Available chapters: {', '.join(CHAPTERS.keys())}")
+            print(f"Available chapters: {', '.join(discover_chapters().keys())}")
             sys.exit(1)
 
-        summary = await generate_summary(args.chapter, client)
+        summary = await generate_summary(args.chapter, client, cache, limiter)
         if summary:
             save_summary(summary, args.chapter)
     else:
-        # Generate for all chapters
-        for chapter_id in CHAPTERS:
-            summary = await generate_summary(chapter_id, client)
-            if summary:
+        # Generate for all chapters concurrently, bounded by a semaphore
+        # so we don't exceed the Gemini rate limit
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def process(chapter_id: str) -> dict | None:
+            async with semaphore:
+                return await generate_summary(chapter_id, client, cache, limiter)
+
+        chapter_ids = list(discover_chapters())
+        results = await asyncio.gather(
+            *[process(chapter_id) for chapter_id in chapter_ids],
+            return_exceptions=True,
+        )
+
+        for chapter_id, summary in zip(chapter_ids, results):
+            if isinstance(summary, BaseException):
+                print(f"Failed to generate summary for {chapter_id}: {summary}")
+            elif summary:
                 save_summary(summary, chapter_id)
-            await asyncio.sleep(1)  # Rate limiting
+
+    cache.close()
 
     print("Summary generation complete!")
 
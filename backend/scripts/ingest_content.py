@@ -14,7 +14,11 @@ Usage:
 
 import argparse
 import asyncio
+import bisect
 import hashlib
+import itertools
+import json
+import operator
 import re
 import sys
 import uuid
@@ -30,8 +34,17 @@ load_dotenv()
 
 import cohere
 import google.generativeai as genai
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, PointStruct, VectorParams
+import httpx
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    Distance,
+    OptimizersConfigDiff,
+    PointStruct,
+    VectorParams,
+)
+
+from scripts import _llm_cache, _markdown_cache
 
 # Import config directly without triggering src.core.__init__.py
 import importlib.util
@@ -54,6 +67,22 @@ EMBEDDING_DIMENSIONS = {
     "gemini": 768,   # text-embedding-004
 }
 
+# Patterns compiled once at import so the per-sentence/per-chunk hot
+# paths skip the re-module cache lookups.
+# Sentence boundaries: whitespace after a terminator, or any newline run
+# (matches the old sub-then-split('\n') behavior in one pass)
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+|\s*\n\s*')
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Fused scan: code blocks and heading lines found in one pass over the
+# body. The alternation tries code fences first, so headings inside
+# fenced blocks are consumed by the code branch and never indexed
+_SCAN_RE = re.compile(
+    r'(?P<code>```[\s\S]*?```)'
+    r'|(?P<heading>^[ \t]*#{1,6}[ \t]+(?P<htitle>.+?)[ \t]*$)',
+    re.MULTILINE,
+)
+
 
 def extract_frontmatter(content: str) -> tuple[dict, str]:
     """Extract YAML frontmatter from markdown content.
@@ -79,167 +108,232 @@ def extract_frontmatter(content: str) -> tuple[dict, str]:
     return frontmatter, content
 
 
-def split_into_sentences(text: str) -> list[str]:
-    """Split text into sentences.
+def _iter_sentence_spans(text: str) -> Generator[tuple[str, int], None, None]:
+    """Iterate sentences along with their start offsets in text.
 
     Args:
         text: Text to split
 
+    Yields:
+        Tuples of (sentence, start_offset)
+    """
+
+    def emit(piece: str, start: int) -> Generator[tuple[str, int], None, None]:
+        stripped = piece.strip()
+        if stripped:
+            yield stripped, start + (len(piece) - len(piece.lstrip()))
+
+    pos = 0
+    for match in _SENT_SPLIT_RE.finditer(text):
+        yield from emit(text[pos:match.start()], pos)
+        pos = match.end()
+    yield from emit(text[pos:], pos)
+
+
+def _split_long_sentence(sentence: str, chunk_size: int) -> list[str]:
+    """Split an oversized sentence into word-bounded pieces.
+
+    Args:
+        sentence: Sentence longer than chunk_size
+        chunk_size: Maximum piece size in characters
+
     Returns:
-        List of sentences
+        List of pieces, each at most chunk_size characters
     """
-    # Simple sentence splitting on common terminators
-    # Handles abbreviations like "e.g." and "i.e." by not splitting on them
-    text = re.sub(r'([.!?])\s+', r'\1\n', text)
-    sentences = [s.strip() for s in text.split('\n') if s.strip()]
-    return sentences
+    pieces = []
+    current = []
+    size = 0
+
+    for word in sentence.split():
+        if size + len(word) + 1 > chunk_size and current:
+            pieces.append(" ".join(current))
+            current = []
+            size = 0
+        current.append(word)
+        size += len(word) + 1
+
+    if current:
+        pieces.append(" ".join(current))
+
+    return pieces
 
 
 def chunk_content(
     content: str,
     chunk_size: int = CHUNK_SIZE,
     overlap: int = CHUNK_OVERLAP
-) -> Generator[tuple[str, int], None, None]:
+) -> Generator[tuple[str, int, int], None, None]:
     """Split content into overlapping chunks.
 
     Uses sentence-aware splitting to avoid breaking mid-sentence.
 
+    Args:
+        content: Text content to chunk
+        chunk_size: Target size of each chunk in characters
+        overlap: Number of characters to overlap between chunks
+
+    The cut decisions are vectorized: sentence lengths are prefix-summed
+    with NumPy once, then every chunk boundary (and the sentence-aligned
+    overlap step-back) is a binary search into that array, instead of
+    per-sentence Python arithmetic and branching.
+
     Args:
         content: Text content to chunk
         chunk_size: Target size of each chunk in characters
         overlap: Number of characters to overlap between chunks
 
     Yields:
-        Tuples of (chunk_text, chunk_order)
+        Tuples of (chunk_text, chunk_order, start_offset) where
+        start_offset is the position in content of the chunk's first
+        sentence
     """
-    # Clean content - remove code blocks for chunking (we'll handle them separately)
-    # But preserve them in the output
-    sentences = split_into_sentences(content)
+    # Materialize sentences, splitting any single sentence longer than
+    # chunk_size into word-bounded pieces so every entry fits a chunk
+    pieces = []
+    offsets = []
+    for sentence, offset in _iter_sentence_spans(content):
+        if len(sentence) > chunk_size:
+            for part in _split_long_sentence(sentence, chunk_size):
+                pieces.append(part)
+                offsets.append(offset)
+        else:
+            pieces.append(sentence)
+            offsets.append(offset)
+
+    if not pieces:
+        return
 
-    current_chunk = []
-    current_size = 0
+    # Prefix sums of sentence lengths (+1 for the joining space); every
+    # boundary below is a searchsorted into this array
+    cum = np.cumsum(
+        np.fromiter((len(p) + 1 for p in pieces), dtype=np.int64, count=len(pieces))
+    )
+
+    total = len(pieces)
     chunk_order = 0
+    start = 0
 
-    for sentence in sentences:
-        sentence_size = len(sentence)
-
-        # If single sentence is larger than chunk_size, split it
-        if sentence_size > chunk_size:
-            # Yield current chunk first if not empty
-            if current_chunk:
-                yield " ".join(current_chunk), chunk_order
-                chunk_order += 1
-                current_chunk = []
-                current_size = 0
-
-            # Split long sentence into smaller parts
-            words = sentence.split()
-            temp_chunk = []
-            temp_size = 0
-
-            for word in words:
-                if temp_size + len(word) + 1 > chunk_size and temp_chunk:
-                    yield " ".join(temp_chunk), chunk_order
-                    chunk_order += 1
-                    temp_chunk = []
-                    temp_size = 0
-                temp_chunk.append(word)
-                temp_size += len(word) + 1
-
-            if temp_chunk:
-                current_chunk = temp_chunk
-                current_size = temp_size
-            continue
+    while start < total:
+        base = int(cum[start - 1]) if start else 0
+        # Furthest sentence whose cumulative size stays within budget
+        end = int(np.searchsorted(cum, base + chunk_size, side="right"))
+        end = max(end, start + 1)  # always take at least one sentence
 
-        # Check if adding this sentence exceeds chunk size
-        if current_size + sentence_size + 1 > chunk_size and current_chunk:
-            yield " ".join(current_chunk), chunk_order
-            chunk_order += 1
+        yield " ".join(pieces[start:end]), chunk_order, offsets[start]
+        chunk_order += 1
 
-            # Start new chunk with overlap from previous
-            overlap_text = " ".join(current_chunk)[-overlap:] if overlap > 0 else ""
-            current_chunk = [overlap_text] if overlap_text else []
-            current_size = len(overlap_text)
+        if end >= total:
+            break
 
-        current_chunk.append(sentence)
-        current_size += sentence_size + 1
+        if overlap > 0:
+            # Step back to the sentence boundary that keeps ~overlap
+            # trailing characters as context for the next chunk
+            back = int(
+                np.searchsorted(cum, int(cum[end - 1]) - overlap, side="right")
+            )
+            start = max(back, start + 1)
+        else:
+            start = end
 
-    # Yield final chunk
-    if current_chunk:
-        yield " ".join(current_chunk), chunk_order
 
+def scan_markdown(body: str) -> tuple[str, list[str], list[tuple[int, str, str]]]:
+    """Extract code blocks and index headings in one pass over the body.
 
-def extract_section_info(content: str, position: int) -> tuple[str, str]:
-    """Extract section heading for a position in content.
+    A single scan of the fused pattern replaces separate
+    findall/sub/heading passes, each of which walked the full text. The
+    clean body is assembled from the slices between code blocks, and
+    heading offsets are recorded directly in clean-body coordinates so
+    they line up with the chunker's offsets.
 
     Args:
-        content: Full markdown content
+        body: Markdown body (frontmatter already removed)
+
+    Returns:
+        Tuple of (clean body with [CODE_BLOCK] placeholders, code
+        blocks, heading index of (offset, section_id, section_title))
+    """
+    parts = []
+    code_blocks = []
+    headings = []
+    pos = 0  # consumed up to here in body
+    out_len = 0  # length of clean body emitted so far
+
+    for match in _SCAN_RE.finditer(body):
+        code = match.group('code')
+        if code is not None:
+            parts.append(body[pos:match.start()])
+            parts.append('[CODE_BLOCK]')
+            out_len += match.start() - pos + len('[CODE_BLOCK]')
+            code_blocks.append(code)
+            pos = match.end()
+        else:
+            # Heading line passes through; its clean-body offset is what
+            # has been emitted plus the pending slice before it
+            offset = out_len + (match.start() - pos)
+            title = match.group('htitle')
+            section_id = _SLUG_RE.sub('-', title.lower()).strip('-')
+            headings.append((offset, section_id, title))
+
+    parts.append(body[pos:])
+
+    return ''.join(parts), code_blocks, headings
+
+
+def lookup_section(headings: list[tuple[int, str, str]], position: int) -> tuple[str, str]:
+    """Find the section heading governing a position in content.
+
+    Args:
+        headings: Heading index from scan_markdown()
         position: Character position to find section for
 
     Returns:
         Tuple of (section_id, section_title)
     """
-    lines = content[:position].split('\n')
-
-    section_id = "intro"
-    section_title = "Introduction"
-
-    for line in reversed(lines):
-        # Match markdown headings
-        match = re.match(r'^(#{1,6})\s+(.+)$', line.strip())
-        if match:
-            level = len(match.group(1))
-            title = match.group(2).strip()
-            # Create slug from title
-            section_id = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
-            section_title = title
-            break
-
+    idx = bisect.bisect_right(headings, position, key=lambda h: h[0]) - 1
+    if idx < 0:
+        return "intro", "Introduction"
+    _, section_id, section_title = headings[idx]
     return section_id, section_title
 
 
-def process_markdown_file(
-    file_path: Path,
+def chunk_markdown(
+    content: str,
+    chapter_id: str,
     language: str = "en"
 ) -> Generator[dict, None, None]:
-    """Process a markdown file and yield chunk metadata.
+    """Chunk markdown content and yield chunk metadata.
 
     Args:
-        file_path: Path to markdown file
+        content: Raw markdown content (including frontmatter)
+        chapter_id: Chapter identifier (e.g., "chapter-1")
         language: Language code (en, ur)
 
     Yields:
         Dict with chunk metadata
     """
-    content = file_path.read_text(encoding="utf-8")
     frontmatter, body = extract_frontmatter(content)
-
-    # Extract chapter info from path
-    chapter_id = file_path.parent.name  # e.g., "chapter-1"
     title = frontmatter.get("title", chapter_id.replace("-", " ").title())
 
-    # Clean body - remove code blocks for better chunking
-    # Store code blocks separately
-    code_block_pattern = r'```[\s\S]*?```'
-    code_blocks = re.findall(code_block_pattern, body)
-    clean_body = re.sub(code_block_pattern, '[CODE_BLOCK]', body)
+    # One fused pass pulls out code blocks (kept separately, better
+    # chunking without them) and indexes headings in clean-body
+    # coordinates, the same text the chunker walks
+    clean_body, code_blocks, headings = scan_markdown(body)
 
-    # Track position for section detection
-    position = 0
-
-    for chunk_text, chunk_order in chunk_content(clean_body):
+    for chunk_text, chunk_order, start_offset in chunk_content(clean_body):
         # Skip empty chunks or just code block placeholders
         if not chunk_text.strip() or chunk_text.strip() == '[CODE_BLOCK]':
             continue
 
         # Find section for this chunk
-        section_id, section_title = extract_section_info(body, position)
-        position += len(chunk_text)
-
-        # Generate unique ID for chunk
-        chunk_hash = hashlib.md5(
-            f"{chapter_id}:{chunk_order}:{chunk_text[:50]}".encode()
-        ).hexdigest()[:12]
+        section_id, section_title = lookup_section(headings, start_offset)
+
+        # Generate unique ID for chunk. blake2b is faster than md5 and a
+        # 6-byte digest is plenty for a disambiguator (the ID is already
+        # namespaced by chapter and order)
+        chunk_hash = hashlib.blake2b(
+            f"{chapter_id}:{chunk_order}:{chunk_text[:50]}".encode(),
+            digest_size=6,
+        ).hexdigest()
         chunk_id = f"{chapter_id}-{chunk_order}-{chunk_hash}"
 
         yield {
@@ -254,39 +348,96 @@ def process_markdown_file(
         }
 
 
+async def process_markdown_file(
+    file_path: Path,
+    language: str = "en"
+) -> list[dict]:
+    """Process a markdown file into chunk metadata.
+
+    Parsing goes through the shared markdown cache, so a file whose
+    mtime and size haven't changed skips both the read and the regex
+    work on re-runs. The read-and-parse for misses runs in a worker
+    thread, keeping the event loop free.
+
+    Args:
+        file_path: Path to markdown file
+        language: Language code (en, ur)
+
+    Returns:
+        List of chunk metadata dicts
+    """
+    chapter_id = file_path.parent.name  # e.g., "chapter-1"
+    return await asyncio.to_thread(
+        _markdown_cache.parse_file,
+        file_path,
+        f"ingest-chunks-{language}",
+        lambda content: list(chunk_markdown(content, chapter_id, language)),
+    )
+
+
 # Global clients (initialized in main)
 cohere_client: cohere.AsyncClient | None = None
 embedding_provider: str = "cohere"
 
+# On-disk embedding cache (initialized in main); re-running ingest over
+# unchanged chapters then skips the embedding API entirely
+embedding_cache: _llm_cache.LLMCache | None = None
+
 
-async def generate_embedding(text: str) -> list[float]:
-    """Generate embedding for text using configured provider.
+def _partition_cached(
+    model_name: str,
+    texts: list[str],
+) -> tuple[list[str], list[list[float] | None], list[int]]:
+    """Split texts into cache hits and misses.
 
     Args:
-        text: Text to embed
+        model_name: Embedding model name (part of the cache key)
+        texts: Texts to embed
 
     Returns:
-        Embedding vector
+        Tuple of (keys, embeddings with hits filled in, miss indices)
     """
-    global cohere_client, embedding_provider
+    keys = [_llm_cache.make_embedding_key(model_name, text) for text in texts]
+    embeddings: list[list[float] | None] = [None] * len(texts)
+    misses = []
+
+    for i, key in enumerate(keys):
+        cached = embedding_cache.get(key) if embedding_cache is not None else None
+        if cached is not None:
+            embeddings[i] = json.loads(cached)
+        else:
+            misses.append(i)
 
-    if embedding_provider == "cohere":
-        if cohere_client is None:
-            raise ValueError("Cohere client not initialized")
-        response = await cohere_client.embed(
-            texts=[text],
-            model=settings.cohere_embedding_model,
-            input_type="search_document",
-            embedding_types=["float"],
-        )
-        return response.embeddings.float_[0]
-    else:
+    return keys, embeddings, misses
+
+
+async def generate_embeddings_batch_gemini(texts: list[str]) -> list[list[float]]:
+    """Generate embeddings for multiple texts using Gemini (batch API).
+
+    Passing a list of contents returns one embedding per entry from a
+    single request, amortizing the HTTP round-trip across the batch
+    (Gemini accepts up to 100 contents per call).
+
+    Args:
+        texts: List of texts to embed
+
+    Returns:
+        List of embedding vectors
+    """
+    keys, embeddings, misses = _partition_cached(settings.embedding_model, texts)
+
+    if misses:
         result = await genai.embed_content_async(
             model=f"models/{settings.embedding_model}",
-            content=text,
+            content=[texts[i] for i in misses],
             task_type="retrieval_document",
         )
-        return result["embedding"]
+        for i, embedding in zip(misses, result["embedding"]):
+            embeddings[i] = embedding
+            if embedding_cache is not None:
+                embedding_cache.set(keys[i], json.dumps(embedding))
+
+    return embeddings
 
 
 async def generate_embeddings_batch_cohere(texts: list[str]) -> list[list[float]]:
@@ -303,129 +454,245 @@ async def generate_embeddings_batch_cohere(texts: list[str]) -> list[list[float]
     if cohere_client is None:
         raise ValueError("Cohere client not initialized")
 
-    response = await cohere_client.embed(
-        texts=texts,
-        model=settings.cohere_embedding_model,
-        input_type="search_document",
-        embedding_types=["float"],
-    )
-    return response.embeddings.float_
+    # Serve what we can from the on-disk cache and only send misses to
+    # the API, scattering results back into their original slots
+    keys, embeddings, misses = _partition_cached(settings.cohere_embedding_model, texts)
 
+    if misses:
+        response = await cohere_client.embed(
+            texts=[texts[i] for i in misses],
+            model=settings.cohere_embedding_model,
+            input_type="search_document",
+            embedding_types=["float"],
+        )
+        for i, embedding in zip(misses, response.embeddings.float_):
+            embeddings[i] = embedding
+            if embedding_cache is not None:
+                embedding_cache.set(keys[i], json.dumps(embedding))
 
-async def process_chunks_batch(
-    chunks: list[dict],
-    batch_size: int = 96  # Cohere supports up to 96 texts per batch
-) -> list[dict]:
-    """Process chunks in batches to generate embeddings.
+    return embeddings
+
+
+# How many embedding batches may be in flight at once. Keeps the API
+# busy without tripping provider rate limits.
+MAX_INFLIGHT_BATCHES = 8
+
+# Retry budget for transient embedding failures (429s, timeouts)
+MAX_EMBED_ATTEMPTS = 5
 
-    Uses Cohere's batch API for efficiency when using Cohere provider.
+
+async def embed_batch_with_retry(texts: list[str], batch_num: int) -> list[list[float]]:
+    """Embed one batch of texts, retrying transient failures with backoff.
 
     Args:
-        chunks: List of chunk metadata dicts
-        batch_size: Number of chunks to process per batch (max 96 for Cohere)
+        texts: Texts to embed
+        batch_num: 1-based batch number (for log messages)
 
     Returns:
-        Chunks with embeddings added
+        List of embedding vectors
     """
     global embedding_provider
-    results = []
 
-    for i in range(0, len(chunks), batch_size):
-        batch = chunks[i:i + batch_size]
-        print(f"  Processing batch {i // batch_size + 1}/{(len(chunks) + batch_size - 1) // batch_size}...")
+    for attempt in range(1, MAX_EMBED_ATTEMPTS + 1):
+        try:
+            # Both providers accept the whole batch in one request
+            if embedding_provider == "cohere":
+                return await generate_embeddings_batch_cohere(texts)
+            return await generate_embeddings_batch_gemini(texts)
+        except Exception as e:
+            if attempt == MAX_EMBED_ATTEMPTS:
+                raise
+            delay = min(2 ** attempt, 30)
+            print(f"  Batch {batch_num} failed ({e}), retrying in {delay}s...")
+            await asyncio.sleep(delay)
 
-        if embedding_provider == "cohere":
-            # Use Cohere's efficient batch API
-            texts = [chunk["chunk_text"] for chunk in batch]
-            embeddings = await generate_embeddings_batch_cohere(texts)
-        else:
-            # Gemini: generate embeddings one by one
-            tasks = [generate_embedding(chunk["chunk_text"]) for chunk in batch]
-            embeddings = await asyncio.gather(*tasks)
+    raise RuntimeError("unreachable")  # pragma: no cover
 
-        for chunk, embedding in zip(batch, embeddings):
-            chunk["embedding"] = embedding
-            results.append(chunk)
 
-        # Small delay to avoid rate limiting
-        await asyncio.sleep(0.2)
+async def run_embed_upsert_pipeline(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    chunks: list[dict],
+    batch_size: int = 96  # Cohere supports up to 96 texts per batch
+) -> int:
+    """Embed chunks and stream them into Qdrant as they complete.
 
-    return results
+    Producer/consumer pipeline: embedding batches run concurrently
+    (bounded by a semaphore) and finished batches flow through a small
+    queue to an upsert consumer. Upload latency overlaps embedding
+    latency, and peak memory is bounded by the queue instead of holding
+    every embedding before the first upsert starts.
 
+    Args:
+        client: Qdrant client
+        collection_name: Name of collection
+        chunks: List of chunk metadata dicts
+        batch_size: Number of chunks to embed per batch (max 96 for Cohere)
+
+    Returns:
+        Number of points uploaded
+    """
+    batches = [chunks[i:i + batch_size] for i in range(0, len(chunks), batch_size)]
+    print(f"  Embedding {len(batches)} batches ({MAX_INFLIGHT_BATCHES} in flight)...")
+
+    # Holds a few finished batches; embedding stalls if uploads lag
+    queue: asyncio.Queue[list[dict] | None] = asyncio.Queue(maxsize=4)
+    semaphore = asyncio.Semaphore(MAX_INFLIGHT_BATCHES)
+    failed: list[dict] = []
 
-def setup_qdrant_collection(
-    client: QdrantClient,
+    async def embed_one(batch_num: int, batch: list[dict]) -> None:
+        async with semaphore:
+            texts = [chunk["chunk_text"] for chunk in batch]
+            try:
+                embeddings = await embed_batch_with_retry(texts, batch_num)
+            except Exception as e:
+                # Park the batch for a later re-run instead of crashing
+                print(f"  Batch {batch_num} failed after retries: {e}")
+                failed.extend(batch)
+                return
+        for chunk, embedding in zip(batch, embeddings):
+            chunk["embedding"] = embedding
+        await queue.put(batch)
+
+    async def producer() -> None:
+        await asyncio.gather(*[embed_one(i + 1, b) for i, b in enumerate(batches)])
+        await queue.put(None)  # signal completion to the consumer
+
+    uploaded = 0
+    # A couple of uploads in flight lets transfer overlap server-side
+    # processing; beyond that the server is the bottleneck
+    upload_semaphore = asyncio.Semaphore(settings.qdrant_upsert_concurrency)
+
+    async def upload_one(batch: list[dict]) -> None:
+        nonlocal uploaded
+        async with upload_semaphore:
+            await client.upsert(
+                collection_name=collection_name,
+                points=[
+                    PointStruct(
+                        id=str(_uuid5(_UUID_NAMESPACE, chunk["id"])),
+                        vector=chunk["embedding"],
+                        payload=dict(zip(_PAYLOAD_KEYS, _payload_values(chunk))),
+                    )
+                    for chunk in batch
+                ],
+                wait=False,
+            )
+            uploaded += len(batch)
+
+    async def consumer() -> None:
+        uploads: list[asyncio.Task[None]] = []
+        while (batch := await queue.get()) is not None:
+            uploads.append(asyncio.create_task(upload_one(batch)))
+        await asyncio.gather(*uploads)
+
+    await asyncio.gather(producer(), consumer())
+
+    if failed:
+        with FAILED_CHUNKS_PATH.open("w", encoding="utf-8") as f:
+            for chunk in failed:
+                f.write(json.dumps(chunk) + "\n")
+        print(f"  {len(failed)} chunks failed to embed; saved to {FAILED_CHUNKS_PATH}")
+
+    return uploaded
+
+
+# Indexing threshold restored once bulk upload finishes (Qdrant default)
+INDEXING_THRESHOLD = 20000
+
+# Cap on concurrently open markdown files (avoids fd exhaustion)
+MAX_OPEN_FILES = 16
+
+# Chunks whose batch still fails after retries land here for reprocessing
+FAILED_CHUNKS_PATH = Path("ingest_failed.jsonl")
+
+
+async def setup_qdrant_collection(
+    client: AsyncQdrantClient,
     collection_name: str,
     recreate: bool = False,
     dimension: int = 1024
 ) -> None:
     """Set up Qdrant collection for storing embeddings.
 
+    Indexing is disabled (indexing_threshold=0) so HNSW construction is
+    deferred until after the bulk upload; finalize_qdrant_collection()
+    re-enables it.
+
     Args:
         client: Qdrant client
         collection_name: Name of collection
         recreate: Whether to delete and recreate existing collection
         dimension: Vector dimension (1024 for Cohere, 768 for Gemini)
     """
-    collections = client.get_collections()
+    collections = await client.get_collections()
     exists = any(c.name == collection_name for c in collections.collections)
 
     if exists and recreate:
         print(f"Deleting existing collection: {collection_name}")
-        client.delete_collection(collection_name)
+        await client.delete_collection(collection_name)
         exists = False
 
     if not exists:
         print(f"Creating collection: {collection_name} (dimension={dimension})")
-        client.create_collection(
+        await client.create_collection(
             collection_name=collection_name,
             vectors_config=VectorParams(
                 size=dimension,
                 distance=Distance.COSINE,
             ),
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=0),
+        )
+    else:
+        # Existing collection: pause indexing for the duration of the upload
+        await client.update_collection(
+            collection_name=collection_name,
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=0),
         )
 
 
-def upsert_chunks_to_qdrant(
-    client: QdrantClient,
+async def finalize_qdrant_collection(
+    client: AsyncQdrantClient,
     collection_name: str,
-    chunks: list[dict]
 ) -> None:
-    """Upload chunks with embeddings to Qdrant.
+    """Re-enable indexing after bulk upload completes.
 
     Args:
         client: Qdrant client
         collection_name: Name of collection
-        chunks: List of chunks with embeddings
     """
-    points = []
-
-    for chunk in chunks:
-        point = PointStruct(
-            id=str(uuid.uuid5(uuid.NAMESPACE_DNS, chunk["id"])),
-            vector=chunk["embedding"],
-            payload={
-                "chunk_id": chunk["id"],
-                "chapter_id": chunk["chapter_id"],
-                "section_id": chunk["section_id"],
-                "section_title": chunk["section_title"],
-                "chapter_title": chunk["chapter_title"],
-                "chunk_text": chunk["chunk_text"],
-                "chunk_order": chunk["chunk_order"],
-                "language": chunk["language"],
-            }
-        )
-        points.append(point)
+    await client.update_collection(
+        collection_name=collection_name,
+        optimizers_config=OptimizersConfigDiff(indexing_threshold=INDEXING_THRESHOLD),
+    )
 
-    # Upsert in batches
-    batch_size = 100
-    for i in range(0, len(points), batch_size):
-        batch = points[i:i + batch_size]
-        client.upsert(
-            collection_name=collection_name,
-            points=batch,
-        )
-        print(f"  Uploaded {min(i + batch_size, len(points))}/{len(points)} points")
+
+# Payload construction: one itemgetter call per chunk instead of eight
+# interpreted subscript lookups ("id" is stored as "chunk_id")
+_PAYLOAD_KEYS = (
+    "chunk_id",
+    "chapter_id",
+    "section_id",
+    "section_title",
+    "chapter_title",
+    "chunk_text",
+    "chunk_order",
+    "language",
+)
+_payload_values = operator.itemgetter(
+    "id",
+    "chapter_id",
+    "section_id",
+    "section_title",
+    "chapter_title",
+    "chunk_text",
+    "chunk_order",
+    "language",
+)
+
+# Pre-bound globals keep attribute lookups out of the per-chunk loop
+_uuid5 = uuid.uuid5
+_UUID_NAMESPACE = uuid.NAMESPACE_DNS
 
 
 async def main():
@@ -460,31 +727,62 @@ async def main():
         default=settings.embedding_provider,
         help="Embedding provider to use (default: from config)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk embedding cache and always call the API"
+    )
+    parser.add_argument(
+        "--ttl-days",
+        type=float,
+        default=30,
+        help="Maximum age of cached embeddings in days (default: 30)"
+    )
 
     args = parser.parse_args()
 
+    global embedding_cache
+
     # Set embedding provider
     embedding_provider = args.provider
+    embedding_cache = _llm_cache.LLMCache(
+        db_path=_llm_cache.EMBEDDINGS_DB,
+        ttl_days=args.ttl_days,
+        enabled=not args.no_cache,
+    )
     dimension = EMBEDDING_DIMENSIONS[embedding_provider]
     print(f"Using embedding provider: {embedding_provider} (dimension={dimension})")
 
     # Configure embedding provider
+    http_client = None
     if embedding_provider == "cohere":
         if not settings.cohere_api_key:
             print("Error: COHERE_API_KEY not set in environment")
             sys.exit(1)
-        cohere_client = cohere.AsyncClient(api_key=settings.cohere_api_key)
+        # HTTP/2 multiplexes the concurrent embedding batches over one
+        # connection instead of queueing them behind HTTP/1.1 limits
+        http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=60,
+        )
+        cohere_client = cohere.AsyncClient(
+            api_key=settings.cohere_api_key,
+            httpx_client=http_client,
+        )
         print(f"Cohere model: {settings.cohere_embedding_model}")
     else:
         if not settings.gemini_api_key:
             print("Error: GEMINI_API_KEY not set in environment")
             sys.exit(1)
-        genai.configure(api_key=settings.gemini_api_key)
+        # grpc_asyncio gives Gemini the same single multiplexed HTTP/2
+        # channel (the SDK doesn't take an external httpx client)
+        genai.configure(api_key=settings.gemini_api_key, transport="grpc_asyncio")
         print(f"Gemini model: {settings.embedding_model}")
 
     # Set up Qdrant client
     if settings.qdrant_url:
-        client = QdrantClient(
+        client = AsyncQdrantClient(
             url=settings.qdrant_url,
             api_key=settings.qdrant_api_key,
         )
@@ -493,7 +791,7 @@ async def main():
         qdrant_path = Path(settings.qdrant_path)
         qdrant_path.mkdir(parents=True, exist_ok=True)
         print(f"Using local Qdrant storage at: {qdrant_path.absolute()}")
-        client = QdrantClient(path=str(qdrant_path))
+        client = AsyncQdrantClient(path=str(qdrant_path))
 
     # Find content directory
     content_dir = Path(args.content_dir)
@@ -519,33 +817,44 @@ async def main():
 
     print(f"Found {len(md_files)} markdown files")
 
-    # Process all files
-    all_chunks = []
-    for file_path in md_files:
-        print(f"\nProcessing: {file_path.relative_to(content_dir.parent.parent)}")
-        chunks = list(process_markdown_file(file_path, args.language))
-        print(f"  Generated {len(chunks)} chunks")
-        all_chunks.extend(chunks)
+    # Process all files concurrently: reads overlap with parsing across
+    # files, and the semaphore caps how many files are open at once
+    print("\nProcessing files...")
+    file_semaphore = asyncio.Semaphore(MAX_OPEN_FILES)
 
-    print(f"\nTotal chunks: {len(all_chunks)}")
+    async def load_file(file_path: Path) -> list[dict]:
+        async with file_semaphore:
+            return await process_markdown_file(file_path, args.language)
+
+    chunk_lists = await asyncio.gather(*[load_file(fp) for fp in md_files])
+
+    for file_path, chunks in zip(md_files, chunk_lists):
+        print(f"  {file_path.relative_to(content_dir.parent.parent)}: {len(chunks)} chunks")
 
-    # Generate embeddings
-    print("\nGenerating embeddings...")
-    chunks_with_embeddings = await process_chunks_batch(all_chunks)
+    all_chunks = list(itertools.chain.from_iterable(chunk_lists))
+
+    print(f"\nTotal chunks: {len(all_chunks)}")
 
     # Set up collection with correct dimension for embedding provider
     print(f"\nSetting up Qdrant collection: {args.collection}")
-    setup_qdrant_collection(client, args.collection, args.recreate, dimension)
+    await setup_qdrant_collection(client, args.collection, args.recreate, dimension)
+
+    # Embed and upload as one streaming pipeline
+    print("\nGenerating embeddings and uploading to Qdrant...")
+    uploaded = await run_embed_upsert_pipeline(client, args.collection, all_chunks)
+
+    # Re-enable indexing now that the bulk upload is done
+    await finalize_qdrant_collection(client, args.collection)
 
-    # Upload to Qdrant
-    print("\nUploading to Qdrant...")
-    upsert_chunks_to_qdrant(client, args.collection, chunks_with_embeddings)
+    embedding_cache.close()
+    if http_client is not None:
+        await http_client.aclose()
 
-    print(f"\nIngestion complete! {len(chunks_with_embeddings)} chunks stored in '{args.collection}'")
+    print(f"\nIngestion complete! {uploaded} chunks stored in '{args.collection}'")
 
     # Print sample
-    if chunks_with_embeddings:
-        sample = chunks_with_embeddings[0]
+    if all_chunks:
+        sample = all_chunks[0]
         print("\nSample chunk:")
         print(f"  ID: {sample['id']}")
         print(f"  Chapter: {sample['chapter_title']}")
@@ -25,11 +25,22 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+import aiofiles
 import google.generativeai as genai
 
+from scripts import _llm_cache, _markdown_cache
+from scripts.generate_quizzes import retry_with_backoff
 from src.core.config import settings
 
 
+# Sections translated concurrently within a file; the retry helper
+# backs off on rate-limit errors if this proves too aggressive
+TRANSLATE_CONCURRENCY = 4
+
+# Low temperature for consistent translations (also part of the cache key)
+TRANSLATION_TEMPERATURE = 0.3
+
+
 # Translation system prompt
 TRANSLATION_SYSTEM_PROMPT = """You are an expert translator specializing in technical and educational content translation from English to Urdu.
 
@@ -48,82 +59,71 @@ The text may contain [CODE_BLOCK_N] placeholders - leave these exactly as they a
 Translate the following content to Urdu:"""
 
 
-def extract_code_blocks(content: str) -> tuple[str, list[str]]:
-    """Extract code blocks from markdown and replace with placeholders.
-
-    Args:
-        content: Markdown content
-
-    Returns:
-        Tuple of (content with placeholders, list of code blocks)
-    """
-    code_blocks = []
-
-    # Pattern for fenced code blocks (```...```)
-    pattern = r'```[\s\S]*?```'
-
-    def replace_block(match):
-        code_blocks.append(match.group(0))
-        return f'[CODE_BLOCK_{len(code_blocks) - 1}]'
-
-    modified_content = re.sub(pattern, replace_block, content)
+# Patterns compiled once at import so per-file calls skip the re-module
+# cache lookups. Code spans are fused into one alternation: fenced
+# blocks are tried first so their backticks never match as inline code
+_CODE_SPAN_RE = re.compile(r'(?P<block>```[\s\S]*?```)|(?P<inline>`[^`]+`)')
+_PLACEHOLDER_RE = re.compile(r'\[(CODE_BLOCK|INLINE_CODE)_(\d+)\]')
+_SECTION_SPLIT_RE = re.compile(r'(^#{1,6}\s+.+$)', re.MULTILINE)
 
-    return modified_content, code_blocks
 
+def tokenize_markdown(content: str) -> tuple[str, str, list[str], list[str]]:
+    """Split markdown into frontmatter, placeholdered body and code spans.
 
-def extract_inline_code(content: str) -> tuple[str, list[str]]:
-    """Extract inline code from markdown and replace with placeholders.
+    A single fused scan replaces the separate code-block and inline-code
+    passes, each of which copied the full content. The [CODE_BLOCK_N] /
+    [INLINE_CODE_N] placeholder protocol stays as-is because the
+    translation prompt contracts on it.
 
     Args:
-        content: Markdown content (after code blocks extracted)
+        content: Full markdown content
 
     Returns:
-        Tuple of (content with placeholders, list of inline code)
+        Tuple of (frontmatter, body with placeholders, code blocks,
+        inline codes)
     """
-    inline_codes = []
+    frontmatter, body = extract_frontmatter(content)
 
-    # Pattern for inline code (`...`)
-    pattern = r'`[^`]+`'
+    code_blocks = []
+    inline_codes = []
 
-    def replace_code(match):
-        inline_codes.append(match.group(0))
+    def replace_span(match):
+        block = match.group('block')
+        if block is not None:
+            code_blocks.append(block)
+            return f'[CODE_BLOCK_{len(code_blocks) - 1}]'
+        inline_codes.append(match.group('inline'))
         return f'[INLINE_CODE_{len(inline_codes) - 1}]'
 
-    modified_content = re.sub(pattern, replace_code, content)
+    return frontmatter, _CODE_SPAN_RE.sub(replace_span, body), code_blocks, inline_codes
 
-    return modified_content, inline_codes
 
+def restore_placeholders(
+    content: str,
+    code_blocks: list[str],
+    inline_codes: list[str],
+) -> str:
+    """Restore code blocks and inline code from placeholders.
 
-def restore_code_blocks(content: str, code_blocks: list[str]) -> str:
-    """Restore code blocks from placeholders.
+    One compiled-regex pass indexes straight into the span lists,
+    instead of one full str.replace scan per placeholder. Placeholders
+    the model mangled (or indices out of range) are left untouched.
 
     Args:
         content: Content with placeholders
         code_blocks: List of original code blocks
-
-    Returns:
-        Content with code blocks restored
-    """
-    for i, block in enumerate(code_blocks):
-        content = content.replace(f'[CODE_BLOCK_{i}]', block)
-
-    return content
-
-
-def restore_inline_code(content: str, inline_codes: list[str]) -> str:
-    """Restore inline code from placeholders.
-
-    Args:
-        content: Content with placeholders
         inline_codes: List of original inline code
 
     Returns:
-        Content with inline code restored
+        Content with all code spans restored
     """
-    for i, code in enumerate(inline_codes):
-        content = content.replace(f'[INLINE_CODE_{i}]', code)
 
-    return content
+    def replace(match):
+        spans = code_blocks if match.group(1) == 'CODE_BLOCK' else inline_codes
+        index = int(match.group(2))
+        return spans[index] if index < len(spans) else match.group(0)
+
+    return _PLACEHOLDER_RE.sub(replace, content)
 
 
 def extract_frontmatter(content: str) -> tuple[str, str]:
@@ -185,6 +185,7 @@ async def translate_file(
     source_path: Path,
     output_path: Path,
     model: genai.GenerativeModel,
+    cache: _llm_cache.LLMCache,
 ) -> None:
     """Translate a single markdown file.
 
@@ -192,53 +193,60 @@ async def translate_file(
         source_path: Path to source English file
         output_path: Path for translated file
         model: Gemini model instance
+        cache: On-disk cache of already-translated sections
     """
     print(f"Translating: {source_path.name}")
 
-    # Read source content
-    content = source_path.read_text(encoding='utf-8')
-
-    # Extract frontmatter
-    frontmatter, body = extract_frontmatter(content)
-
-    # Extract code blocks (preserve them)
-    body_no_code, code_blocks = extract_code_blocks(body)
-
-    # Extract inline code
-    body_no_inline, inline_codes = extract_inline_code(body_no_code)
+    # Tokenize through the shared markdown cache: an unchanged file
+    # skips the read and the code-span scan on re-runs, and misses are
+    # parsed in a worker thread (code stays in English)
+    frontmatter, body_no_inline, code_blocks, inline_codes = await asyncio.to_thread(
+        _markdown_cache.parse_file, source_path, 'translate-tokens', tokenize_markdown
+    )
 
     print(f"  - Found {len(code_blocks)} code blocks, {len(inline_codes)} inline code")
 
     # Split into chunks for translation (avoid token limits)
     # Translate in sections based on headings
-    sections = re.split(r'(^#{1,6}\s+.+$)', body_no_inline, flags=re.MULTILINE)
-
-    translated_sections = []
-    for i, section in enumerate(sections):
-        if not section.strip():
-            translated_sections.append(section)
-            continue
-
-        # Translate section
-        try:
-            translated = await translate_text(section, model)
-            translated_sections.append(translated)
-            print(f"  - Translated section {i + 1}/{len(sections)}")
-        except Exception as e:
-            print(f"  - Error translating section {i + 1}: {e}")
-            translated_sections.append(section)  # Keep original on error
-
-        # Rate limiting
-        await asyncio.sleep(1)
-
-    # Reassemble
-    translated_body = ''.join(translated_sections)
-
-    # Restore inline code
-    translated_body = restore_inline_code(translated_body, inline_codes)
+    sections = _SECTION_SPLIT_RE.split(body_no_inline)
+
+    # Translate sections concurrently (bounded by a semaphore) instead of
+    # one call plus a fixed 1s sleep per section; failed sections keep
+    # their original text, results land back in their original slots
+    translated_sections = list(sections)
+    semaphore = asyncio.Semaphore(TRANSLATE_CONCURRENCY)
+
+    async def translate_section(index: int, section: str) -> None:
+        # Sections already translated in an earlier (possibly crashed)
+        # run come straight from the cache, so re-runs only pay for
+        # work that hasn't completed yet
+        cache_key = _llm_cache.make_key(
+            settings.generation_model,
+            TRANSLATION_TEMPERATURE,
+            f"{TRANSLATION_SYSTEM_PROMPT}\n\n{section}",
+        )
+        async with semaphore:
+            try:
+                translated_sections[index] = await cache.get_or_set(
+                    cache_key,
+                    lambda: retry_with_backoff(lambda: translate_text(section, model)),
+                )
+                print(f"  - Translated section {index + 1}/{len(sections)}")
+            except Exception as e:
+                print(f"  - Error translating section {index + 1}: {e}")
+
+    await asyncio.gather(
+        *[
+            translate_section(i, section)
+            for i, section in enumerate(sections)
+            if section.strip()
+        ]
+    )
 
-    # Restore code blocks
-    translated_body = restore_code_blocks(translated_body, code_blocks)
+    # Reassemble and restore code spans in one pass
+    translated_body = restore_placeholders(
+        ''.join(translated_sections), code_blocks, inline_codes
+    )
 
     # Combine with frontmatter
     final_content = frontmatter + translated_body
@@ -246,8 +254,9 @@ async def translate_file(
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write translated file
-    output_path.write_text(final_content, encoding='utf-8')
+    # Write translated file without blocking the event loop
+    async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
+        await f.write(final_content)
     print(f"  - Saved to: {output_path}")
 
 
@@ -268,6 +277,17 @@ async def main():
         "--chapter",
         help="Translate only a specific chapter (e.g., chapter-1)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk translation cache and always call Gemini"
+    )
+    parser.add_argument(
+        "--ttl-days",
+        type=float,
+        default=30,
+        help="Maximum age of cached translations in days (default: 30)"
+    )
 
     args = parser.parse_args()
 
@@ -282,10 +302,12 @@ async def main():
     model = genai.GenerativeModel(
         model_name=settings.generation_model,
         generation_config=genai.GenerationConfig(
-            temperature=0.3,  # Low temperature for consistent translations
+            temperature=TRANSLATION_TEMPERATURE,
         ),
     )
 
+    cache = _llm_cache.LLMCache(ttl_days=args.ttl_days, enabled=not args.no_cache)
+
     # Find source directory
     source_dir = Path(args.source)
     if not source_dir.exists():
@@ -320,7 +342,9 @@ async def main():
         relative_path = source_path.relative_to(source_dir)
         output_path = output_dir / relative_path
 
-        await translate_file(source_path, output_path, model)
+        await translate_file(source_path, output_path, model, cache)
+
+    cache.close()
 
     print(f"\nTranslation complete! {len(md_files)} files translated.")
 
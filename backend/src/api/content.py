@@ -3,18 +3,43 @@
 Provides endpoints for accessing chapter content, summaries, and related data.
 """
 
-import json
+import hashlib
+import logging
+import os
+import threading
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+import orjson
+
+from fastapi import APIRouter, Header, HTTPException, Response
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/content", tags=["content"])
 
 # Path to summaries directory
 SUMMARIES_DIR = Path(__file__).parent.parent.parent.parent / "content" / "summaries"
 
+# Summary listing cached against the directory's mtime: adding, removing
+# or replacing a summary file bumps it, so unchanged directories serve
+# the cached list without touching disk. The pre-encoded JSON bytes are
+# cached alongside the data so hot requests also skip Pydantic
+# validation and serialization.
+_summaries_cache: tuple[int, list[dict[str, Any]], bytes] | None = None
+
+# Per-chapter summary responses as pre-encoded bytes with their ETag,
+# keyed by chapter_id and invalidated on the summary file's mtime
+_summary_bytes_cache: dict[str, tuple[int, bytes, str]] = {}
+
+_summaries_lock = threading.Lock()
+
+
+def _make_etag(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
 
 class KeyConcept(BaseModel):
     """A key concept from a chapter summary."""
@@ -54,57 +79,165 @@ def load_summary(chapter_id: str) -> dict[str, Any] | None:
     if not file_path.exists():
         return None
 
-    with open(file_path, encoding="utf-8") as f:
-        return json.load(f)
+    # orjson parses bytes directly, skipping the UTF-8 decode a text
+    # read would do
+    return orjson.loads(file_path.read_bytes())
 
 
 def get_available_summaries() -> list[dict[str, Any]]:
     """Get list of available chapter summaries.
 
+    The scan is cached in-process and only redone when the summaries
+    directory's mtime changes, so steady-state requests skip the
+    per-file open and JSON parse entirely.
+
     Returns:
         List of chapter info dicts.
     """
+    global _summaries_cache
+
+    if not SUMMARIES_DIR.exists():
+        return []
+
+    mtime_ns = SUMMARIES_DIR.stat().st_mtime_ns
+    cached = _summaries_cache
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    # scandir returns entries with cached stat info in one syscall
+    # batch, avoiding the per-match stat that Path.glob does. This loop
+    # only runs when the directory changed; cache hits above never set
+    # up an exception handler
     summaries = []
-    if SUMMARIES_DIR.exists():
-        for file_path in SUMMARIES_DIR.glob("*-summary.json"):
+    failed: list[str] = []
+    with os.scandir(SUMMARIES_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith("-summary.json") or not entry.is_file():
+                continue
             try:
-                with open(file_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                    summaries.append({
-                        "chapter_id": data.get("chapter_id"),
-                        "title": data.get("title"),
-                        "has_summary": True,
-                    })
-            except (json.JSONDecodeError, KeyError):
+                with open(entry.path, "rb") as f:
+                    data = orjson.loads(f.read())
+                summaries.append({
+                    "chapter_id": data.get("chapter_id"),
+                    "title": data.get("title"),
+                    "has_summary": True,
+                })
+            except (orjson.JSONDecodeError, KeyError):
+                failed.append(entry.name)
+
+    if failed:
+        logger.warning(f"Skipped malformed summary files: {', '.join(sorted(failed))}")
+
+    summaries.sort(key=lambda x: x.get("chapter_id", ""))
+    # Validate once through the response model, then freeze the encoded
+    # body so per-request serialization disappears with the parse
+    body = orjson.dumps([ChapterListItem(**s).model_dump() for s in summaries])
+    with _summaries_lock:
+        _summaries_cache = (mtime_ns, summaries, body)
+    return summaries
+
+
+def preload_summaries() -> int:
+    """Parse and validate all summary files, warming the response caches.
+
+    Called once from the application lifespan so the first request to
+    the summary endpoints is served from memory. The caches stay keyed
+    on mtimes, so files changed after startup are still picked up.
+
+    Returns:
+        Number of summaries preloaded.
+    """
+    if not SUMMARIES_DIR.exists():
+        return 0
+
+    # Warms the listing cache as a side effect
+    get_available_summaries()
+
+    count = 0
+    failed: list[str] = []
+    with os.scandir(SUMMARIES_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith("-summary.json") or not entry.is_file():
+                continue
+            chapter_id = entry.name.removesuffix("-summary.json")
+            try:
+                mtime_ns = entry.stat().st_mtime_ns
+                with open(entry.path, "rb") as f:
+                    summary = ChapterSummary(**orjson.loads(f.read()))
+            except (OSError, orjson.JSONDecodeError, TypeError, ValidationError):
+                failed.append(entry.name)
                 continue
 
-    return sorted(summaries, key=lambda x: x.get("chapter_id", ""))
+            body = summary.model_dump_json().encode("utf-8")
+            with _summaries_lock:
+                _summary_bytes_cache[chapter_id] = (mtime_ns, body, _make_etag(body))
+            count += 1
+
+    if failed:
+        logger.warning(
+            f"Skipped invalid summary files at preload: {', '.join(sorted(failed))}"
+        )
+
+    return count
 
 
 @router.get("/summaries", response_model=list[ChapterListItem])
-async def list_summaries() -> list[ChapterListItem]:
+async def list_summaries() -> Response:
     """List all available chapter summaries.
 
     Returns:
         List of chapters with summary availability.
     """
-    summaries = get_available_summaries()
-    return [ChapterListItem(**s) for s in summaries]
+    # Refreshes the cache if the directory changed; the pre-encoded body
+    # is stored alongside the data it was built from
+    get_available_summaries()
+    cached = _summaries_cache
+    body = cached[2] if cached is not None else b"[]"
+    return Response(content=body, media_type="application/json")
+
+
+def _summary_response(body: bytes, etag: str, if_none_match: str | None) -> Response:
+    """Build the summary response, honoring If-None-Match with a 304."""
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "public, max-age=300"},
+    )
 
 
 @router.get("/summaries/{chapter_id}", response_model=ChapterSummary)
-async def get_summary(chapter_id: str) -> ChapterSummary:
+async def get_summary(
+    chapter_id: str,
+    if_none_match: str | None = Header(None),
+) -> Response:
     """Get summary for a specific chapter.
 
     Args:
         chapter_id: Chapter identifier (e.g., "chapter-1").
+        if_none_match: Client's cached ETag, for 304 responses.
 
     Returns:
-        Chapter summary with overview, key concepts, and takeaways.
+        Chapter summary with overview, key concepts, and takeaways, or
+        a bodyless 304 if the client's cached copy is current.
 
     Raises:
         HTTPException: If summary not found.
     """
+    file_path = SUMMARIES_DIR / f"{chapter_id}-summary.json"
+    try:
+        mtime_ns = file_path.stat().st_mtime_ns
+    except OSError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Summary not found for chapter: {chapter_id}",
+        )
+
+    cached = _summary_bytes_cache.get(chapter_id)
+    if cached is not None and cached[0] == mtime_ns:
+        return _summary_response(cached[1], cached[2], if_none_match)
+
     summary = load_summary(chapter_id)
     if not summary:
         raise HTTPException(
@@ -112,36 +245,55 @@ async def get_summary(chapter_id: str) -> ChapterSummary:
             detail=f"Summary not found for chapter: {chapter_id}",
         )
 
-    return ChapterSummary(**summary)
+    # Validate once on miss, then serve the encoded body until the file
+    # changes
+    body = ChapterSummary(**summary).model_dump_json().encode("utf-8")
+    etag = _make_etag(body)
+    with _summaries_lock:
+        _summary_bytes_cache[chapter_id] = (mtime_ns, body, etag)
+    return _summary_response(body, etag, if_none_match)
+
+
+# The chapter list is static, so the payload is encoded once at import
+# and served as cached bytes with an ETag for client-side 304s
+# For now, chapters mirror the available summaries
+# In a full implementation, this would query the database
+_CHAPTERS_BYTES = orjson.dumps([
+    {
+        "id": "chapter-1",
+        "title": "Introduction to Humanoid Robotics",
+        "slug": "chapter-1",
+        "order": 1,
+    },
+    {
+        "id": "chapter-2",
+        "title": "Robot Components and Architecture",
+        "slug": "chapter-2",
+        "order": 2,
+    },
+    {
+        "id": "chapter-3",
+        "title": "Sensors and Actuators",
+        "slug": "chapter-3",
+        "order": 3,
+    },
+])
+_CHAPTERS_ETAG = f'"{hashlib.blake2b(_CHAPTERS_BYTES, digest_size=8).hexdigest()}"'
 
 
 @router.get("/chapters")
-async def list_chapters() -> list[dict[str, Any]]:
+async def list_chapters(if_none_match: str | None = Header(None)) -> Response:
     """List all chapters with basic metadata.
 
     Returns:
-        List of chapter metadata.
+        List of chapter metadata, or 304 if the client's cached copy
+        is current.
     """
-    # For now, return chapters based on available summaries
-    # In a full implementation, this would query the database
-    chapters = [
-        {
-            "id": "chapter-1",
-            "title": "Introduction to Humanoid Robotics",
-            "slug": "chapter-1",
-            "order": 1,
-        },
-        {
-            "id": "chapter-2",
-            "title": "Robot Components and Architecture",
-            "slug": "chapter-2",
-            "order": 2,
-        },
-        {
-            "id": "chapter-3",
-            "title": "Sensors and Actuators",
-            "slug": "chapter-3",
-            "order": 3,
-        },
-    ]
-    return chapters
+    if if_none_match == _CHAPTERS_ETAG:
+        return Response(status_code=304, headers={"ETag": _CHAPTERS_ETAG})
+
+    return Response(
+        content=_CHAPTERS_BYTES,
+        media_type="application/json",
+        headers={"ETag": _CHAPTERS_ETAG, "Cache-Control": "public, max-age=3600"},
+    )
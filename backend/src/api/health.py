@@ -3,8 +3,10 @@
 Provides endpoints for monitoring application health and dependencies.
 """
 
+import asyncio
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
@@ -12,12 +14,40 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
-from src.core.database import get_db
+from src.core.database import get_db_ro
+
+# Client accessors resolved once at import instead of per request; a
+# missing optional dependency leaves the symbol as None and the check
+# reports not_configured
+try:
+    from src.core.qdrant import get_qdrant_client
+except ImportError:
+    get_qdrant_client = None
+
+try:
+    from src.core.gemini import get_gemini_client
+except ImportError:
+    get_gemini_client = None
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
+# Short-TTL caches so monitoring traffic doesn't hammer the database,
+# Qdrant and Gemini on every probe. Each cache has its own lock that
+# single-flights refreshes: while one coroutine reruns the checks,
+# concurrent callers wait and reuse its result
+_READY_TTL_SECONDS = 2.0
+_DETAILED_TTL_SECONDS = 5.0
+_ready_cache: tuple[float, "SimpleHealth"] | None = None
+_detailed_cache: tuple[float, "HealthStatus"] | None = None
+_ready_lock = asyncio.Lock()
+_detailed_lock = asyncio.Lock()
+
+# Constants per process; no point rebuilding them per report
+_VERSION = "0.1.0"
+_ENVIRONMENT = "development" if settings.debug else "production"
+
 
 class HealthStatus(BaseModel):
     """Health check response model."""
@@ -56,68 +86,89 @@ async def liveness_check():
 
 
 @router.get("/ready", response_model=SimpleHealth)
-async def readiness_check(db: AsyncSession = Depends(get_db)):
+async def readiness_check(db: AsyncSession = Depends(get_db_ro)):
     """Kubernetes-style readiness probe.
 
     Indicates if the application is ready to receive traffic.
-    Checks database connectivity.
+    Checks database connectivity. Results are cached for a couple of
+    seconds to keep probe storms off the database.
     """
-    try:
-        # Test database connection
-        await db.execute(text("SELECT 1"))
-        return SimpleHealth(status="ready")
-    except Exception as e:
-        logger.error(f"Readiness check failed: {e}")
-        return SimpleHealth(status="not_ready")
+    global _ready_cache
 
+    cached = _ready_cache
+    if cached is not None and time.monotonic() - cached[0] < _READY_TTL_SECONDS:
+        return cached[1]
 
-@router.get("/detailed", response_model=HealthStatus)
-async def detailed_health_check(db: AsyncSession = Depends(get_db)):
-    """Detailed health check with dependency status.
+    async with _ready_lock:
+        cached = _ready_cache
+        if cached is not None and time.monotonic() - cached[0] < _READY_TTL_SECONDS:
+            return cached[1]
 
-    Checks all external dependencies and returns comprehensive status.
-    """
-    checks: dict[str, dict[str, str | bool | int]] = {}
+        try:
+            # Test database connection
+            await db.execute(text("SELECT 1"))
+            result = SimpleHealth(status="ready")
+        except Exception as e:
+            logger.error(f"Readiness check failed: {e}")
+            result = SimpleHealth(status="not_ready")
+
+        _ready_cache = (time.monotonic(), result)
+        return result
 
-    # Check database
+
+async def _check_database(db: AsyncSession) -> dict[str, str | bool | int]:
+    """Check database connectivity."""
     try:
         await db.execute(text("SELECT 1"))
-        checks["database"] = {"status": "healthy", "connected": True}
+        return {"status": "healthy", "connected": True}
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
-        checks["database"] = {"status": "unhealthy", "connected": False, "error": str(e)}
+        return {"status": "unhealthy", "connected": False, "error": str(e)}
 
-    # Check Qdrant (vector database)
-    try:
-        from src.core.qdrant import get_qdrant_client
 
-        client = get_qdrant_client()
+async def _check_qdrant() -> dict[str, str | bool | int]:
+    """Check Qdrant (vector database) connectivity."""
+    try:
+        client = get_qdrant_client() if get_qdrant_client else None
         if client:
-            # Try to get collections list
-            collections = client.get_collections()
-            checks["qdrant"] = {
+            collections = await client.get_collections()
+            return {
                 "status": "healthy",
                 "connected": True,
                 "collections": len(collections.collections),
             }
-        else:
-            checks["qdrant"] = {"status": "not_configured", "connected": False}
+        return {"status": "not_configured", "connected": False}
     except Exception as e:
         logger.warning(f"Qdrant health check failed: {e}")
-        checks["qdrant"] = {"status": "unhealthy", "connected": False, "error": str(e)}
+        return {"status": "unhealthy", "connected": False, "error": str(e)}
 
-    # Check Gemini API (for text generation)
-    try:
-        from src.core.gemini import get_gemini_client
 
-        gemini_client = get_gemini_client()
+async def _check_gemini() -> dict[str, str | bool | int]:
+    """Check Gemini API (for text generation) configuration."""
+    try:
+        gemini_client = get_gemini_client() if get_gemini_client else None
         if gemini_client and settings.gemini_api_key:
-            checks["gemini"] = {"status": "configured", "connected": True}
-        else:
-            checks["gemini"] = {"status": "not_configured", "connected": False}
+            return {"status": "configured", "connected": True}
+        return {"status": "not_configured", "connected": False}
     except Exception as e:
         logger.warning(f"Gemini health check failed: {e}")
-        checks["gemini"] = {"status": "unhealthy", "connected": False, "error": str(e)}
+        return {"status": "unhealthy", "connected": False, "error": str(e)}
+
+
+async def _run_detailed_checks(db: AsyncSession) -> HealthStatus:
+    """Run all dependency checks and build the health report.
+
+    The database, Qdrant and Gemini checks are independent, so they
+    run concurrently and the endpoint's latency is the slowest
+    dependency rather than the sum of all three.
+    """
+    checks: dict[str, dict[str, str | bool | int]] = {}
+
+    checks["database"], checks["qdrant"], checks["gemini"] = await asyncio.gather(
+        _check_database(db),
+        _check_qdrant(),
+        _check_gemini(),
+    )
 
     # Check Cohere API (for embeddings)
     try:
@@ -149,10 +200,38 @@ async def detailed_health_check(db: AsyncSession = Depends(get_db)):
             overall_status = "unhealthy"
             break
 
+    # Computed once per TTL-cache refresh, not per probe; utcnow() is
+    # deprecated in favor of timezone-aware now()
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
     return HealthStatus(
         status=overall_status,
-        timestamp=datetime.utcnow().isoformat(),
-        version="0.1.0",
-        environment="development" if settings.debug else "production",
+        timestamp=timestamp,
+        version=_VERSION,
+        environment=_ENVIRONMENT,
         checks=checks,
     )
+
+
+@router.get("/detailed", response_model=HealthStatus)
+async def detailed_health_check(db: AsyncSession = Depends(get_db_ro)):
+    """Detailed health check with dependency status.
+
+    Checks all external dependencies and returns comprehensive status.
+    Results are cached for a few seconds so monitoring load doesn't
+    turn into traffic against Qdrant and Gemini.
+    """
+    global _detailed_cache
+
+    cached = _detailed_cache
+    if cached is not None and time.monotonic() - cached[0] < _DETAILED_TTL_SECONDS:
+        return cached[1]
+
+    async with _detailed_lock:
+        cached = _detailed_cache
+        if cached is not None and time.monotonic() - cached[0] < _DETAILED_TTL_SECONDS:
+            return cached[1]
+
+        result = await _run_detailed_checks(db)
+        _detailed_cache = (time.monotonic(), result)
+        return result
@@ -3,17 +3,36 @@
 Provides endpoints for quiz access, attempts, and scoring.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import hashlib
+import time
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
-from src.core.security import get_current_user_optional
-from src.models.user import User
+from src.core.database import get_db, get_db_ro
+from src.core.security import get_current_user_id_optional
 from src.services.quiz_service import QuizService
 
 router = APIRouter(prefix="/quiz", tags=["Quizzes"])
 
+# Quiz content is editorial and changes rarely, so the fully-rendered
+# questions payload is cached per chapter as encoded bytes with a
+# short TTL rather than rebuilt from the database on every request
+_QUIZ_QUESTIONS_TTL_SECONDS = 300.0
+_quiz_questions_cache: dict[str, tuple[float, bytes, str]] = {}
+
+
+def _questions_response(body: bytes, etag: str, if_none_match: str | None) -> Response:
+    """Build the questions response, honoring If-None-Match with a 304."""
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "public, max-age=300"},
+    )
+
 
 # Request/Response schemas
 class QuizSummaryResponse(BaseModel):
@@ -111,7 +130,7 @@ class AttemptSummaryResponse(BaseModel):
 @router.get("/chapter/{chapter_id}", response_model=QuizSummaryResponse)
 async def get_quiz_for_chapter(
     chapter_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ):
     """Get quiz summary for a chapter.
 
@@ -132,37 +151,49 @@ async def get_quiz_for_chapter(
 @router.get("/chapter/{chapter_id}/questions", response_model=QuizQuestionsResponse)
 async def get_quiz_questions(
     chapter_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
+    if_none_match: str | None = Header(None),
 ):
     """Get quiz questions for a chapter.
 
     Returns questions without correct answers for taking the quiz.
+    Responses are cached per chapter for a few minutes so repeat
+    requests skip the database and serialization entirely; clients
+    holding the current ETag get a bodyless 304.
     """
+    cached = _quiz_questions_cache.get(chapter_id)
+    if cached is not None and time.monotonic() - cached[0] < _QUIZ_QUESTIONS_TTL_SECONDS:
+        return _questions_response(cached[1], cached[2], if_none_match)
+
     service = QuizService(db)
-    quiz = await service.get_quiz_for_chapter(chapter_id)
+    quiz_with_questions = await service.get_quiz_with_questions(chapter_id)
 
-    if not quiz:
+    if not quiz_with_questions:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No quiz found for chapter: {chapter_id}",
         )
 
-    questions = await service.get_quiz_questions(chapter_id)
+    quiz, questions = quiz_with_questions
 
-    return QuizQuestionsResponse(
+    body = QuizQuestionsResponse(
         quiz_id=quiz.id,
         chapter_id=chapter_id,
         title=quiz.title,
         questions=[QuestionResponse(**q.to_dict()) for q in questions],
         time_limit_minutes=quiz.time_limit_minutes,
-    )
+    ).model_dump_json().encode("utf-8")
+
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    _quiz_questions_cache[chapter_id] = (time.monotonic(), body, etag)
+    return _questions_response(body, etag, if_none_match)
 
 
 @router.post("/start", response_model=StartAttemptResponse)
 async def start_quiz_attempt(
     request: StartAttemptRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User | None = Depends(get_current_user_optional),
+    user_id: str | None = Depends(get_current_user_id_optional),
 ):
     """Start a new quiz attempt.
 
@@ -173,7 +204,7 @@ async def start_quiz_attempt(
     try:
         attempt = await service.start_attempt(
             chapter_id=request.chapter_id,
-            user_id=current_user.id if current_user else None,
+            user_id=user_id,
         )
     except ValueError as e:
         raise HTTPException(
@@ -228,7 +259,7 @@ async def submit_quiz_answers(
 @router.get("/attempt/{attempt_id}", response_model=QuizResultResponse)
 async def get_attempt_result(
     attempt_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ):
     """Get result for a completed quiz attempt."""
     service = QuizService(db)
@@ -259,13 +290,13 @@ async def get_attempt_result(
 async def get_user_quiz_history(
     chapter_id: str | None = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User | None = Depends(get_current_user_optional),
+    user_id: str | None = Depends(get_current_user_id_optional),
 ):
     """Get quiz attempt history for current user.
 
     Optionally filter by chapter ID.
     """
-    if not current_user:
+    if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication required to view quiz history",
@@ -273,7 +304,7 @@ async def get_user_quiz_history(
 
     service = QuizService(db)
     attempts = await service.get_user_attempts(
-        user_id=current_user.id,
+        user_id=user_id,
         chapter_id=chapter_id,
     )
 
@@ -282,7 +313,7 @@ async def get_user_quiz_history(
 
 @router.get("/chapters", response_model=list[QuizSummaryResponse])
 async def list_available_quizzes(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ):
     """List all available quizzes.
 
@@ -290,13 +321,13 @@ async def list_available_quizzes(
     """
     service = QuizService(db)
 
-    # Check known chapters
+    # Check known chapters with one batched query instead of a round
+    # trip per chapter
     chapters = ["chapter-1", "chapter-2", "chapter-3"]
-    quizzes = []
-
-    for chapter_id in chapters:
-        quiz = await service.get_quiz_for_chapter(chapter_id)
-        if quiz:
-            quizzes.append(QuizSummaryResponse(**quiz.to_dict()))
+    quizzes = await service.get_quizzes_for_chapters(chapters)
 
-    return quizzes
+    return [
+        QuizSummaryResponse(**quizzes[chapter_id].to_dict())
+        for chapter_id in chapters
+        if chapter_id in quizzes
+    ]
@@ -3,15 +3,67 @@
 Provides endpoints for RAG-based question answering and chat session management.
 """
 
+import asyncio
+import time
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
-from src.core.security import get_current_user_optional
-from src.models.user import User
+from src.core.config import settings
+from src.core.database import get_db, get_db_ro
+from src.core.security import get_current_user_id_optional
 from src.services.rag_service import RAGService
 
+# Resolved once at import instead of per request; None when the Qdrant
+# client isn't available and the health endpoint reports degraded
+try:
+    from src.core.qdrant import qdrant_client
+except ImportError:
+    qdrant_client = None
+
+# Collection names change rarely; cache them briefly so health probes
+# don't turn into Qdrant list calls. The lock single-flights refreshes
+_COLLECTIONS_TTL_SECONDS = 30.0
+_collections_cache: tuple[float, frozenset[str]] | None = None
+_collections_lock = asyncio.Lock()
+
+
+async def _get_collection_names() -> frozenset[str]:
+    """Get the set of Qdrant collection names, cached with a short TTL."""
+    global _collections_cache
+
+    cached = _collections_cache
+    if cached is not None and time.monotonic() - cached[0] < _COLLECTIONS_TTL_SECONDS:
+        return cached[1]
+
+    async with _collections_lock:
+        cached = _collections_cache
+        if cached is not None and time.monotonic() - cached[0] < _COLLECTIONS_TTL_SECONDS:
+            return cached[1]
+
+        collections = await qdrant_client.get_collections()
+        names = frozenset(c.name for c in collections.collections)
+        _collections_cache = (time.monotonic(), names)
+        return names
+
+
+async def prewarm_qdrant() -> None:
+    """Warm the Qdrant connection and collection cache at startup.
+
+    Establishes the connection pool and verifies the configured
+    collection once, so the first user query doesn't pay setup cost.
+    Failures are left for the health endpoints to report.
+    """
+    if qdrant_client is None:
+        return
+    try:
+        await qdrant_client.get_collection(settings.qdrant_collection)
+        await _get_collection_names()
+    except Exception:
+        pass
+
 router = APIRouter(prefix="/rag", tags=["RAG Chatbot"])
 
 
@@ -79,8 +131,8 @@ class CreateSessionRequest(BaseModel):
 async def query(
     request: QueryRequest,
     db: AsyncSession = Depends(get_db),
-    user: User | None = Depends(get_current_user_optional),
-) -> QueryResponse:
+    user_id: str | None = Depends(get_current_user_id_optional),
+) -> ORJSONResponse:
     """Submit a question to the RAG chatbot.
 
     The chatbot will:
@@ -101,42 +153,33 @@ async def query(
     # Create session if not provided
     session_id = request.session_id
     if not session_id:
-        session = await rag_service.create_session(
-            user_id=user.id if user else None
-        )
+        session = await rag_service.create_session(user_id=user_id)
         session_id = session.id
 
     # Process query
     response = await rag_service.query(
         question=request.question,
         session_id=session_id,
-        user_id=user.id if user else None,
+        user_id=user_id,
         language=request.language,
     )
 
-    return QueryResponse(
-        answer=response.answer,
-        citations=[
-            CitationResponse(
-                chapter_id=c.chapter_id,
-                chapter_title=c.chapter_title,
-                section_id=c.section_id,
-                section_title=c.section_title,
-                text=c.text,
-                relevance_score=c.relevance_score,
-            )
-            for c in response.citations
-        ],
-        is_out_of_scope=response.is_out_of_scope,
-        confidence=response.confidence,
-        session_id=session_id,
-    )
+    # Citations carry kilobytes of chunk text each; encoding the dicts
+    # directly avoids copying them through CitationResponse instances
+    # only for FastAPI to turn them back into dicts
+    return ORJSONResponse({
+        "answer": response.answer,
+        "citations": [c.to_dict() for c in response.citations],
+        "is_out_of_scope": response.is_out_of_scope,
+        "confidence": response.confidence,
+        "session_id": session_id,
+    })
 
 
 @router.post("/sessions", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
 async def create_session(
     db: AsyncSession = Depends(get_db),
-    user: User | None = Depends(get_current_user_optional),
+    user_id: str | None = Depends(get_current_user_id_optional),
 ) -> SessionResponse:
     """Create a new chat session.
 
@@ -144,15 +187,13 @@ async def create_session(
 
     Args:
         db: Database session.
-        user: Optional authenticated user.
+        user_id: Optional authenticated user's id.
 
     Returns:
         Created session info.
     """
     rag_service = RAGService(db)
-    session = await rag_service.create_session(
-        user_id=user.id if user else None
-    )
+    session = await rag_service.create_session(user_id=user_id)
 
     return SessionResponse(
         session_id=session.id,
@@ -163,15 +204,13 @@ async def create_session(
 @router.get("/sessions/{session_id}/history", response_model=HistoryResponse)
 async def get_session_history(
     session_id: str,
-    db: AsyncSession = Depends(get_db),
-    user: User | None = Depends(get_current_user_optional),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> HistoryResponse:
     """Get chat history for a session.
 
     Args:
         session_id: Chat session ID.
         db: Database session.
-        user: Optional authenticated user.
 
     Returns:
         List of messages in the session.
@@ -180,21 +219,13 @@ async def get_session_history(
         HTTPException: If session not found.
     """
     rag_service = RAGService(db)
-    messages = await rag_service.get_session_history(session_id)
+    session_exists, messages = await rag_service.get_session_history(session_id)
 
-    if not messages:
-        # Check if session exists (could be empty)
-        from sqlalchemy import select
-
-        from src.models.chat import ChatSession
-        result = await db.execute(
-            select(ChatSession).where(ChatSession.id == session_id)
+    if not session_exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found",
         )
-        if not result.scalar_one_or_none():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Session not found",
-            )
 
     return HistoryResponse(
         session_id=session_id,
@@ -217,15 +248,11 @@ async def rag_health():
 
     Verifies Qdrant connection and collection existence.
     """
-    from src.core.config import settings
-    from src.core.qdrant import qdrant_client
-
     try:
-        collections = qdrant_client.get_collections()
-        collection_exists = any(
-            c.name == settings.qdrant_collection
-            for c in collections.collections
-        )
+        if qdrant_client is None:
+            raise RuntimeError("Qdrant client not available")
+        collection_names = await _get_collection_names()
+        collection_exists = settings.qdrant_collection in collection_names
 
         return {
             "status": "healthy",
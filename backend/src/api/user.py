@@ -4,23 +4,106 @@ Provides endpoints for user-specific data including reading progress,
 bookmarks, quiz history, and personalized recommendations.
 """
 
+import time
+from collections.abc import Iterator
+from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
 
-from src.core.database import get_db
-from src.core.security import get_current_user
-from src.models.user import User
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, RootModel
+
+from src.core.security import AuthedSession, AuthedSessionRO
 from src.services.progress_service import ProgressService
 
-router = APIRouter(prefix="/user", tags=["user"])
+# Explicit orjson serialization: dashboard payloads bundle progress,
+# bookmarks, quiz history and recommendations, where the stdlib
+# encoder shows up in profiles
+router = APIRouter(
+    prefix="/user", tags=["user"], default_response_class=ORJSONResponse
+)
+
+
+# Dashboard and stats aggregate several queries but are repeatedly
+# identical within seconds, so the encoded responses are cached per
+# user with a short TTL and dropped whenever that user writes progress
+# or bookmarks. In-process rather than Redis: the app runs as a single
+# long-lived process and has no Redis in its stack, so the same keying
+# and invalidation scheme lives in a module dict
+_USER_CACHE_TTL_SECONDS = 60.0
+_user_response_cache: dict[tuple[str, str], tuple[float, bytes]] = {}
+
+
+def _cached_user_body(kind: str, user_id: str) -> bytes | None:
+    """Return the cached response body for (kind, user) if still fresh."""
+    cached = _user_response_cache.get((kind, user_id))
+    if cached is not None and time.monotonic() - cached[0] < _USER_CACHE_TTL_SECONDS:
+        return cached[1]
+    return None
+
+
+def _store_user_body(kind: str, user_id: str, body: bytes) -> None:
+    """Cache an encoded response body for (kind, user)."""
+    _user_response_cache[(kind, user_id)] = (time.monotonic(), body)
+
+
+def _invalidate_user_cache(user_id: str) -> None:
+    """Drop a user's cached dashboard and stats after a write."""
+    _user_response_cache.pop(("dash", user_id), None)
+    _user_response_cache.pop(("stats", user_id), None)
+
+
+# Dashboard sections in payload order; each is encoded and flushed as
+# its own chunk so long progress histories never require the full
+# document in memory at once
+_DASHBOARD_SECTIONS = (
+    "progress",
+    "bookmarks",
+    "quiz_history",
+    "stats",
+    "recommendations",
+)
+
+
+def _dashboard_sections(data: dict[str, Any]) -> Iterator[bytes]:
+    """Yield the dashboard JSON body section by section."""
+    for i, key in enumerate(_DASHBOARD_SECTIONS):
+        prefix = b"{" if i == 0 else b","
+        yield prefix + orjson.dumps(key) + b":" + orjson.dumps(data[key])
+    yield b"}"
+
+
+class PydanticResponse(JSONResponse):
+    """Renders a pre-built Pydantic model without re-validation.
+
+    Values coming off ORM rows are already the right types, so the
+    handlers build response models with model_construct and this class
+    serializes them straight through pydantic-core, skipping both the
+    construction-time validation and FastAPI's response-model pass.
+    Optional fields that are unset are omitted instead of serialized
+    as null, which trims the payload as lists grow.
+    """
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json(exclude_none=True).encode("utf-8")
 
 
 # ==================== Request/Response Models ====================
 
 
+class _ResponseModel(BaseModel):
+    """Shared base for response models.
+
+    One ConfigDict instance serves every response class, and frozen
+    instances match how responses are used: built once, serialized,
+    never mutated.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
 class ProgressUpdateRequest(BaseModel):
     """Request to update reading progress."""
 
@@ -30,7 +113,7 @@ class ProgressUpdateRequest(BaseModel):
     last_position: float = 0.0
 
 
-class ProgressResponse(BaseModel):
+class ProgressResponse(_ResponseModel):
     """Reading progress response."""
 
     chapter_id: str
@@ -38,8 +121,8 @@ class ProgressResponse(BaseModel):
     progress_percent: float
     time_spent_seconds: int
     last_position: float
-    started_at: str | None
-    completed_at: str | None
+    started_at: datetime | None
+    completed_at: datetime | None
 
 
 class BookmarkCreateRequest(BaseModel):
@@ -52,7 +135,7 @@ class BookmarkCreateRequest(BaseModel):
     position: float = 0.0
 
 
-class BookmarkResponse(BaseModel):
+class BookmarkResponse(_ResponseModel):
     """Bookmark response."""
 
     id: str
@@ -61,10 +144,16 @@ class BookmarkResponse(BaseModel):
     title: str
     note: str | None
     position: float
-    created_at: str
+    created_at: datetime
+
 
+# Root models give the list endpoints a single object that
+# PydanticResponse can serialize in one pydantic-core call
+ProgressListResponse = RootModel[list[ProgressResponse]]
+BookmarkListResponse = RootModel[list[BookmarkResponse]]
 
-class DashboardStats(BaseModel):
+
+class DashboardStats(_ResponseModel):
     """Dashboard statistics."""
 
     completed_chapters: int
@@ -75,7 +164,7 @@ class DashboardStats(BaseModel):
     average_quiz_score: float
 
 
-class RecommendationResponse(BaseModel):
+class RecommendationResponse(_ResponseModel):
     """Learning recommendation."""
 
     type: str
@@ -85,11 +174,11 @@ class RecommendationResponse(BaseModel):
     priority: int
 
 
-class DashboardResponse(BaseModel):
+class DashboardResponse(_ResponseModel):
     """Complete dashboard data response."""
 
-    progress: list[dict[str, Any]]
-    bookmarks: list[dict[str, Any]]
+    progress: list[ProgressResponse]
+    bookmarks: list[BookmarkResponse]
     quiz_history: list[dict[str, Any]]
     stats: DashboardStats
     recommendations: list[RecommendationResponse]
@@ -100,26 +189,63 @@ class DashboardResponse(BaseModel):
 
 @router.get("/dashboard", response_model=DashboardResponse)
 async def get_dashboard(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-) -> DashboardResponse:
+    ctx: AuthedSessionRO,
+) -> Response:
     """Get complete dashboard data for the authenticated user.
 
     Returns progress, bookmarks, quiz history, stats, and recommendations.
+    Responses are cached per user for a minute; any progress or
+    bookmark write drops the cached copy.
     """
+    user, db = ctx
+    body = _cached_user_body("dash", user.id)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
     service = ProgressService(db)
     data = await service.get_dashboard_data(user.id)
-    return DashboardResponse(**data)
+    # The service already assembles plain dicts; encoding them
+    # directly skips building a DashboardResponse that FastAPI
+    # would immediately dump back to dicts. Unset optional fields
+    # (notes, section anchors, completion times) are dropped
+    # instead of encoded as null, since these lists grow with user
+    # activity
+    for key in ("progress", "bookmarks", "quiz_history", "recommendations"):
+        data[key] = [
+            {k: v for k, v in item.items() if v is not None}
+            for item in data[key]
+        ]
+
+    def stream() -> Iterator[bytes]:
+        # Encode and send one section at a time, so peak allocation on
+        # a cold build is bounded by the largest section rather than
+        # the whole dashboard. The joined body is kept for the cache,
+        # where warm hits come from anyway
+        chunks: list[bytes] = []
+        for chunk in _dashboard_sections(data):
+            chunks.append(chunk)
+            yield chunk
+        _store_user_body("dash", user.id, b"".join(chunks))
+
+    return StreamingResponse(stream(), media_type="application/json")
 
 
 @router.get("/stats")
 async def get_stats(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-) -> dict[str, Any]:
-    """Get completion statistics for the authenticated user."""
-    service = ProgressService(db)
-    return await service.get_completion_stats(user.id)
+    ctx: AuthedSessionRO,
+) -> Response:
+    """Get completion statistics for the authenticated user.
+
+    Cached per user alongside the dashboard and invalidated by the
+    same writes.
+    """
+    user, db = ctx
+    body = _cached_user_body("stats", user.id)
+    if body is None:
+        service = ProgressService(db)
+        body = orjson.dumps(await service.get_completion_stats(user.id))
+        _store_user_body("stats", user.id, body)
+    return Response(content=body, media_type="application/json")
 
 
 # ==================== Progress Endpoints ====================
@@ -127,58 +253,59 @@ async def get_stats(
 
 @router.get("/progress", response_model=list[ProgressResponse])
 async def get_all_progress(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-) -> list[ProgressResponse]:
+    ctx: AuthedSessionRO,
+) -> PydanticResponse:
     """Get reading progress for all chapters."""
+    user, db = ctx
     service = ProgressService(db)
     progress_list = await service.get_all_progress(user.id)
 
-    return [
-        ProgressResponse(
+    items = [
+        ProgressResponse.model_construct(
             chapter_id=p.chapter_id,
             status=p.status,
             progress_percent=p.progress_percent,
             time_spent_seconds=p.time_spent_seconds,
             last_position=p.last_position,
-            started_at=p.started_at.isoformat() if p.started_at else None,
-            completed_at=p.completed_at.isoformat() if p.completed_at else None,
+            started_at=p.started_at,
+            completed_at=p.completed_at,
         )
         for p in progress_list
     ]
+    return PydanticResponse(ProgressListResponse.model_construct(root=items))
 
 
 @router.get("/progress/{chapter_id}", response_model=ProgressResponse | None)
 async def get_chapter_progress(
     chapter_id: str,
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-) -> ProgressResponse | None:
+    ctx: AuthedSessionRO,
+) -> Response:
     """Get reading progress for a specific chapter."""
+    user, db = ctx
     service = ProgressService(db)
     progress = await service.get_progress(user.id, chapter_id)
 
     if not progress:
-        return None
+        return ORJSONResponse(None)
 
-    return ProgressResponse(
+    return PydanticResponse(ProgressResponse.model_construct(
         chapter_id=progress.chapter_id,
         status=progress.status,
         progress_percent=progress.progress_percent,
         time_spent_seconds=progress.time_spent_seconds,
         last_position=progress.last_position,
-        started_at=progress.started_at.isoformat() if progress.started_at else None,
-        completed_at=progress.completed_at.isoformat() if progress.completed_at else None,
-    )
+        started_at=progress.started_at,
+        completed_at=progress.completed_at,
+    ))
 
 
 @router.post("/progress", response_model=ProgressResponse)
 async def update_progress(
     request: ProgressUpdateRequest,
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-) -> ProgressResponse:
+    ctx: AuthedSession,
+) -> Response:
     """Update reading progress for a chapter."""
+    user, db = ctx
     service = ProgressService(db)
     progress = await service.update_progress(
         user_id=user.id,
@@ -187,37 +314,39 @@ async def update_progress(
         time_spent_seconds=request.time_spent_seconds,
         last_position=request.last_position,
     )
+    _invalidate_user_cache(user.id)
 
-    return ProgressResponse(
+    return PydanticResponse(ProgressResponse.model_construct(
         chapter_id=progress.chapter_id,
         status=progress.status,
         progress_percent=progress.progress_percent,
         time_spent_seconds=progress.time_spent_seconds,
         last_position=progress.last_position,
-        started_at=progress.started_at.isoformat() if progress.started_at else None,
-        completed_at=progress.completed_at.isoformat() if progress.completed_at else None,
-    )
+        started_at=progress.started_at,
+        completed_at=progress.completed_at,
+    ))
 
 
 @router.post("/progress/{chapter_id}/complete", response_model=ProgressResponse)
 async def mark_chapter_complete(
     chapter_id: str,
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-) -> ProgressResponse:
+    ctx: AuthedSession,
+) -> Response:
     """Mark a chapter as completed."""
+    user, db = ctx
     service = ProgressService(db)
     progress = await service.mark_completed(user.id, chapter_id)
+    _invalidate_user_cache(user.id)
 
-    return ProgressResponse(
+    return PydanticResponse(ProgressResponse.model_construct(
         chapter_id=progress.chapter_id,
         status=progress.status,
         progress_percent=progress.progress_percent,
         time_spent_seconds=progress.time_spent_seconds,
         last_position=progress.last_position,
-        started_at=progress.started_at.isoformat() if progress.started_at else None,
-        completed_at=progress.completed_at.isoformat() if progress.completed_at else None,
-    )
+        started_at=progress.started_at,
+        completed_at=progress.completed_at,
+    ))
 
 
 # ==================== Bookmark Endpoints ====================
@@ -225,34 +354,35 @@ async def mark_chapter_complete(
 
 @router.get("/bookmarks", response_model=list[BookmarkResponse])
 async def get_bookmarks(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-) -> list[BookmarkResponse]:
+    ctx: AuthedSessionRO,
+) -> PydanticResponse:
     """Get all bookmarks for the authenticated user."""
+    user, db = ctx
     service = ProgressService(db)
     bookmarks = await service.get_bookmarks(user.id)
 
-    return [
-        BookmarkResponse(
+    items = [
+        BookmarkResponse.model_construct(
             id=b.id,
             chapter_id=b.chapter_id,
             section_id=b.section_id,
             title=b.title,
             note=b.note,
             position=b.position,
-            created_at=b.created_at.isoformat(),
+            created_at=b.created_at,
         )
         for b in bookmarks
     ]
+    return PydanticResponse(BookmarkListResponse.model_construct(root=items))
 
 
 @router.post("/bookmarks", response_model=BookmarkResponse)
 async def create_bookmark(
     request: BookmarkCreateRequest,
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-) -> BookmarkResponse:
+    ctx: AuthedSession,
+) -> Response:
     """Create a new bookmark."""
+    user, db = ctx
     service = ProgressService(db)
     bookmark = await service.create_bookmark(
         user_id=user.id,
@@ -262,31 +392,33 @@ async def create_bookmark(
         note=request.note,
         position=request.position,
     )
+    _invalidate_user_cache(user.id)
 
-    return BookmarkResponse(
+    return PydanticResponse(BookmarkResponse.model_construct(
         id=bookmark.id,
         chapter_id=bookmark.chapter_id,
         section_id=bookmark.section_id,
         title=bookmark.title,
         note=bookmark.note,
         position=bookmark.position,
-        created_at=bookmark.created_at.isoformat(),
-    )
+        created_at=bookmark.created_at,
+    ))
 
 
 @router.delete("/bookmarks/{bookmark_id}")
 async def delete_bookmark(
     bookmark_id: str,
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    ctx: AuthedSession,
 ) -> dict[str, bool]:
     """Delete a bookmark."""
+    user, db = ctx
     service = ProgressService(db)
     deleted = await service.delete_bookmark(user.id, bookmark_id)
 
     if not deleted:
         raise HTTPException(status_code=404, detail="Bookmark not found")
 
+    _invalidate_user_cache(user.id)
     return {"deleted": True}
 
 
@@ -295,11 +427,12 @@ async def delete_bookmark(
 
 @router.get("/recommendations", response_model=list[RecommendationResponse])
 async def get_recommendations(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    ctx: AuthedSessionRO,
 ) -> list[RecommendationResponse]:
     """Get personalized learning recommendations."""
+    user, db = ctx
     service = ProgressService(db)
-    data = await service.get_dashboard_data(user.id)
+    # Only needs the progress and quiz rows, not the full dashboard
+    recs = await service.get_recommendations(user.id)
 
-    return [RecommendationResponse(**r) for r in data["recommendations"]]
+    return [RecommendationResponse(**r) for r in recs]
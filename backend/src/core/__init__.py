@@ -1,14 +1,27 @@
 # Core configuration package
+#
+# The Gemini and Qdrant clients are exposed lazily (PEP 562): importing
+# src.core for settings or database helpers should not pay SDK and
+# client construction at cold start. `from src.core.gemini import ...`
+# style submodule imports keep working unchanged.
+from typing import Any
+
 from src.core.config import Settings, get_settings, settings
 from src.core.database import Base, async_session_maker, engine, get_db, init_db
-from src.core.gemini import GeminiClient, gemini_client, get_gemini_client
-from src.core.qdrant import get_qdrant_client, qdrant_client
 from src.core.security import (
     get_current_user,
     get_current_user_optional,
     require_verified_user,
 )
 
+_LAZY_EXPORTS = {
+    "GeminiClient": ("src.core.gemini", "GeminiClient"),
+    "gemini_client": ("src.core.gemini", "gemini_client"),
+    "get_gemini_client": ("src.core.gemini", "get_gemini_client"),
+    "qdrant_client": ("src.core.qdrant", "qdrant_client"),
+    "get_qdrant_client": ("src.core.qdrant", "get_qdrant_client"),
+}
+
 __all__ = [
     "Settings",
     "get_settings",
@@ -27,3 +40,14 @@ __all__ = [
     "get_current_user_optional",
     "require_verified_user",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve client exports on first access instead of at import."""
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(module_name), attr)
@@ -6,6 +6,8 @@ Provides text embedding capabilities using Cohere's embed API.
 from functools import lru_cache
 
 import cohere
+import httpx
+import numpy as np
 
 from src.core.config import settings
 
@@ -16,35 +18,36 @@ class CohereClient:
     def __init__(self) -> None:
         """Initialize the Cohere client."""
         self._client: cohere.AsyncClient | None = None
-        self._sync_client: cohere.Client | None = None
         self._embedding_model = settings.cohere_embedding_model
 
     @property
     def client(self) -> cohere.AsyncClient:
-        """Get or create the async Cohere client instance."""
+        """Get or create the async Cohere client instance.
+
+        The SDK is handed an explicit httpx.AsyncClient so every call
+        shares one connection pool; only this async client exists per
+        process, so there is no second pool to pay for.
+        """
         if self._client is None:
             if not settings.cohere_api_key:
                 raise ValueError("COHERE_API_KEY not configured")
-            self._client = cohere.AsyncClient(api_key=settings.cohere_api_key)
+            self._client = cohere.AsyncClient(
+                api_key=settings.cohere_api_key,
+                httpx_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=100),
+                    timeout=httpx.Timeout(60.0),
+                ),
+            )
         return self._client
 
-    @property
-    def sync_client(self) -> cohere.Client:
-        """Get or create the sync Cohere client instance."""
-        if self._sync_client is None:
-            if not settings.cohere_api_key:
-                raise ValueError("COHERE_API_KEY not configured")
-            self._sync_client = cohere.Client(api_key=settings.cohere_api_key)
-        return self._sync_client
-
-    async def generate_embedding(self, text: str) -> list[float]:
+    async def generate_embedding(self, text: str) -> np.ndarray:
         """Generate an embedding vector for the given text.
 
         Args:
             text: Text to embed.
 
         Returns:
-            Embedding vector as list of floats.
+            Embedding vector as a float32 numpy array.
         """
         response = await self.client.embed(
             texts=[text],
@@ -52,13 +55,13 @@ class CohereClient:
             input_type="search_document",
             embedding_types=["float"],
         )
-        return response.embeddings.float_[0]
+        return np.asarray(response.embeddings.float_[0], dtype=np.float32)
 
     async def generate_embeddings_batch(
         self,
         texts: list[str],
         input_type: str = "search_document"
-    ) -> list[list[float]]:
+    ) -> np.ndarray:
         """Generate embedding vectors for multiple texts.
 
         Args:
@@ -66,7 +69,7 @@ class CohereClient:
             input_type: Type of input (search_document, search_query, classification, clustering).
 
         Returns:
-            List of embedding vectors.
+            Float32 numpy array of shape (len(texts), dimension).
         """
         response = await self.client.embed(
             texts=texts,
@@ -74,16 +77,16 @@ class CohereClient:
             input_type=input_type,
             embedding_types=["float"],
         )
-        return response.embeddings.float_
+        return np.asarray(response.embeddings.float_, dtype=np.float32)
 
-    async def generate_query_embedding(self, query: str) -> list[float]:
+    async def generate_query_embedding(self, query: str) -> np.ndarray:
         """Generate an embedding vector optimized for queries.
 
         Args:
             query: Query text to embed.
 
         Returns:
-            Embedding vector as list of floats.
+            Embedding vector as a float32 numpy array.
         """
         response = await self.client.embed(
             texts=[query],
@@ -91,46 +94,7 @@ class CohereClient:
             input_type="search_query",
             embedding_types=["float"],
         )
-        return response.embeddings.float_[0]
-
-    def generate_embedding_sync(self, text: str) -> list[float]:
-        """Generate an embedding vector synchronously.
-
-        Args:
-            text: Text to embed.
-
-        Returns:
-            Embedding vector as list of floats.
-        """
-        response = self.sync_client.embed(
-            texts=[text],
-            model=self._embedding_model,
-            input_type="search_document",
-            embedding_types=["float"],
-        )
-        return response.embeddings.float_[0]
-
-    def generate_embeddings_batch_sync(
-        self,
-        texts: list[str],
-        input_type: str = "search_document"
-    ) -> list[list[float]]:
-        """Generate embedding vectors for multiple texts synchronously.
-
-        Args:
-            texts: List of texts to embed.
-            input_type: Type of input.
-
-        Returns:
-            List of embedding vectors.
-        """
-        response = self.sync_client.embed(
-            texts=texts,
-            model=self._embedding_model,
-            input_type=input_type,
-            embedding_types=["float"],
-        )
-        return response.embeddings.float_
+        return np.asarray(response.embeddings.float_[0], dtype=np.float32)
 
     async def generate_text(
         self,
@@ -160,5 +124,16 @@ def get_cohere_client() -> CohereClient:
     return CohereClient()
 
 
+def prewarm_cohere() -> None:
+    """Instantiate the async Cohere client ahead of the first request.
+
+    Called from the application lifespan so client construction and
+    pool setup don't land on the first embedding call. A missing API
+    key leaves the client lazy, matching the previous behavior.
+    """
+    if settings.cohere_api_key:
+        get_cohere_client().client  # noqa: B018 - touch to build the client
+
+
 # Singleton client instance
 cohere_client = get_cohere_client()
@@ -3,7 +3,7 @@
 Loads environment variables and provides typed configuration settings.
 """
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -29,12 +29,20 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./app.db"
+    # Lambda-style serverless runtimes can't hold connections between
+    # invocations; set this to keep NullPool instead of a QueuePool
+    serverless: bool = False
+    # Diagnostic-only: log every SQL statement with bound params.
+    # Deliberately independent of debug, because statement logging is
+    # expensive enough to skew any measurement under load
+    sql_echo: bool = False
 
     # Gemini API
     gemini_api_key: str = ""
     embedding_model: str = "text-embedding-004"
     generation_model: str = "gemini-1.5-flash"
     generation_temperature: float = 0.0
+    gemini_rpm: int = 30  # Requests per minute (free-tier default)
 
     # Cohere API
     cohere_api_key: str = ""
@@ -48,6 +56,18 @@ class Settings(BaseSettings):
     qdrant_api_key: str = ""
     qdrant_collection: str = "textbook_chunks"
     qdrant_path: str = "./qdrant_data"  # Local storage path
+    # gRPC multiplexes over one HTTP/2 channel and is the faster wire
+    # for cloud Qdrant, but needs port 6334 reachable; off by default
+    # so deployments behind HTTP-only proxies keep working
+    qdrant_prefer_grpc: bool = False
+    # Connection pool size for the cloud client; bulk upserts benefit
+    # from more parallel connections than the library default
+    qdrant_pool_size: int = 100
+    # Bulk-upsert tuning: points per upsert request, and how many
+    # upload requests may be in flight at once (more than 2 gives
+    # diminishing returns — the server becomes the bottleneck)
+    qdrant_upsert_batch_size: int = 64
+    qdrant_upsert_concurrency: int = 2
 
     # Authentication
     better_auth_secret: str = ""
@@ -60,9 +80,12 @@ class Settings(BaseSettings):
     # RAG
     rag_top_k: int = 5
 
-    @property
+    @cached_property
     def cors_origins(self) -> list[str]:
-        """Get list of allowed CORS origins."""
+        """Get list of allowed CORS origins.
+
+        Computed once per process; origins never change at runtime.
+        """
         origins = [self.frontend_url]
         # Production Vercel URLs
         origins.extend([
@@ -78,7 +101,8 @@ class Settings(BaseSettings):
                 "http://127.0.0.1:3000",
                 "http://127.0.0.1:5173",
             ])
-        return list(set(origins))
+        # Dedupe while keeping declaration order stable
+        return list(dict.fromkeys(origins))
 
     @property
     def is_production(self) -> bool:
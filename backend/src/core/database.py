@@ -22,21 +22,34 @@ class Base(DeclarativeBase):
 def create_engine():
     """Create async database engine with appropriate configuration.
 
-    For PostgreSQL (including Neon), uses NullPool for serverless compatibility.
-    For SQLite, uses default connection pooling.
+    For PostgreSQL, uses a queue pool sized for a long-lived server
+    process; serverless deployments opt back into NullPool via the
+    `serverless` setting. For SQLite, uses default connection pooling.
     """
     database_url = settings.async_database_url
 
     # Engine configuration
     engine_kwargs = {
-        "echo": settings.debug,
+        "echo": settings.sql_echo,
         "future": True,
     }
 
-    # For PostgreSQL/Neon serverless, disable connection pooling
-    # This prevents "connection closed" errors in serverless environments
     if settings.is_postgres:
-        engine_kwargs["poolclass"] = NullPool
+        if settings.serverless:
+            # Lambda-style environments reap idle connections between
+            # invocations; NullPool prevents "connection closed" errors
+            engine_kwargs["poolclass"] = NullPool
+        else:
+            # Long-lived server process: reuse connections instead of
+            # paying the PostgreSQL handshake on every request.
+            # pool_pre_ping drops stale connections, pool_recycle stays
+            # under typical cloud idle timeouts
+            engine_kwargs.update(
+                pool_size=20,
+                max_overflow=10,
+                pool_pre_ping=True,
+                pool_recycle=1800,
+            )
         # SSL configuration for Neon and other cloud PostgreSQL
         # asyncpg requires boolean or SSLContext, not string values
         if settings.is_production:
@@ -64,13 +77,42 @@ async_session_maker = async_sessionmaker(
 )
 
 
+# Housekeeping timestamp columns that moved from Python-side defaults
+# to server_default=func.now(); tables created before the move need the
+# DDL default added or their inserts fail the NOT NULL constraint
+_TIMESTAMP_DEFAULT_COLUMNS = (
+    ("users", "created_at"),
+    ("users", "updated_at"),
+    ("chat_sessions", "created_at"),
+    ("chat_sessions", "updated_at"),
+    ("reading_progress", "updated_at"),
+    ("bookmarks", "created_at"),
+    ("quizzes", "created_at"),
+    ("quizzes", "updated_at"),
+)
+
+
 async def init_db() -> None:
     """Initialize database by creating all tables.
 
-    Called on application startup to ensure tables exist.
+    Called on application startup to ensure tables exist. On
+    PostgreSQL, also backfills the now() defaults on timestamp columns
+    for tables that predate server-side defaults (idempotent ALTERs;
+    SQLite cannot alter column defaults, so a stale dev database must
+    be recreated instead).
     """
+    from sqlalchemy import text
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        if settings.is_postgres:
+            for table, column in _TIMESTAMP_DEFAULT_COLUMNS:
+                await conn.execute(
+                    text(
+                        f"ALTER TABLE {table} "
+                        f"ALTER COLUMN {column} SET DEFAULT now()"
+                    )
+                )
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -93,3 +135,22 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def get_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency providing a session for read-only handlers.
+
+    Unlike get_db, no COMMIT is sent when the request finishes — for
+    GET endpoints that only read, that round-trip (and the fsync it
+    coordinates on PostgreSQL) is wasted. The transaction is rolled
+    back on exit instead, which is a no-op for pure reads.
+
+    Yields:
+        AsyncSession: Database session for the request.
+    """
+    async with async_session_maker() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
@@ -4,24 +4,103 @@ Provides a unified interface for generating embeddings using either
 Cohere or Google Gemini based on configuration.
 """
 
+import asyncio
 from functools import lru_cache
 from typing import Protocol
 
+import numpy as np
+
 from src.core.config import settings
 
+# Micro-batching knobs: a burst of concurrent RAG requests is coalesced
+# into one provider call of up to 32 texts, waiting at most 10 ms for
+# stragglers before firing
+_BATCH_MAX_SIZE = 32
+_BATCH_MAX_WAIT_SECONDS = 0.01
+
 
 class EmbeddingProvider(Protocol):
     """Protocol for embedding providers."""
 
-    async def generate_embedding(self, text: str) -> list[float]:
+    async def generate_embedding(self, text: str) -> np.ndarray:
         """Generate embedding for a single text."""
         ...
 
-    async def generate_query_embedding(self, query: str) -> list[float]:
+    async def generate_query_embedding(self, query: str) -> np.ndarray:
         """Generate embedding optimized for queries."""
         ...
 
 
+class _EmbeddingBatcher:
+    """Coalesces concurrent single-text embed calls into one batch.
+
+    Each caller enqueues its text with a future and awaits the result;
+    a background worker drains the queue up to _BATCH_MAX_SIZE entries
+    (waiting at most _BATCH_MAX_WAIT_SECONDS for stragglers), issues a
+    single batch call, and fans the vectors back out. This amortizes
+    one network round-trip across a burst of concurrent requests.
+    """
+
+    def __init__(self, embed_batch, input_type: str) -> None:
+        """Initialize the batcher.
+
+        Args:
+            embed_batch: Awaitable taking (texts, input_type) and
+                returning one vector per text, in order.
+            input_type: Input type forwarded to the provider
+                ("document" or "query").
+        """
+        self._embed_batch = embed_batch
+        self._input_type = input_type
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed one text, transparently joining an in-flight batch."""
+        loop = asyncio.get_running_loop()
+        # The queue and worker are bound to an event loop; rebuild them
+        # if a new loop shows up (fresh TestClient, reload)
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = None
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+        fut: asyncio.Future[np.ndarray] = loop.create_future()
+        self._queue.put_nowait((text, fut))
+        return await fut
+
+    async def _run(self) -> None:
+        """Drain the queue in batches and resolve callers' futures."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + _BATCH_MAX_WAIT_SECONDS
+            while len(batch) < _BATCH_MAX_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                vectors = await self._embed_batch(texts, self._input_type)
+                for (_, fut), vector in zip(batch, vectors):
+                    if not fut.cancelled():
+                        fut.set_result(vector)
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.cancelled():
+                        fut.set_exception(e)
+
+
 class EmbeddingService:
     """Unified embedding service that delegates to configured provider."""
 
@@ -30,6 +109,12 @@ class EmbeddingService:
         self._provider = settings.embedding_provider
         self._cohere_client = None
         self._gemini_client = None
+        self._document_batcher = _EmbeddingBatcher(
+            self.generate_embeddings_batch, "document"
+        )
+        self._query_batcher = _EmbeddingBatcher(
+            self.generate_embeddings_batch, "query"
+        )
 
     @property
     def dimension(self) -> int:
@@ -50,43 +135,41 @@ class EmbeddingService:
             self._gemini_client = gemini_client
         return self._gemini_client
 
-    async def generate_embedding(self, text: str) -> list[float]:
+    async def generate_embedding(self, text: str) -> np.ndarray:
         """Generate an embedding vector for the given text.
 
         Uses the configured embedding provider (Cohere or Gemini).
+        Concurrent callers are coalesced into one batched provider
+        request.
 
         Args:
             text: Text to embed.
 
         Returns:
-            Embedding vector as list of floats.
+            Embedding vector as a float32 numpy array.
         """
-        if self._provider == "cohere":
-            return await self._get_cohere_client().generate_embedding(text)
-        else:
-            return await self._get_gemini_client().generate_embedding(text)
+        return await self._document_batcher.embed(text)
 
-    async def generate_query_embedding(self, query: str) -> list[float]:
+    async def generate_query_embedding(self, query: str) -> np.ndarray:
         """Generate an embedding vector optimized for queries.
 
         Uses the configured embedding provider (Cohere or Gemini).
+        Concurrent callers are coalesced into one batched provider
+        request.
 
         Args:
             query: Query text to embed.
 
         Returns:
-            Embedding vector as list of floats.
+            Embedding vector as a float32 numpy array.
         """
-        if self._provider == "cohere":
-            return await self._get_cohere_client().generate_query_embedding(query)
-        else:
-            return await self._get_gemini_client().generate_query_embedding(query)
+        return await self._query_batcher.embed(query)
 
     async def generate_embeddings_batch(
         self,
         texts: list[str],
         input_type: str = "document"
-    ) -> list[list[float]]:
+    ) -> np.ndarray:
         """Generate embeddings for multiple texts.
 
         Args:
@@ -94,7 +177,7 @@ class EmbeddingService:
             input_type: Type of input (document or query).
 
         Returns:
-            List of embedding vectors.
+            Float32 numpy array of shape (len(texts), dimension).
         """
         if self._provider == "cohere":
             cohere_input_type = "search_document" if input_type == "document" else "search_query"
@@ -102,15 +185,12 @@ class EmbeddingService:
                 texts, cohere_input_type
             )
         else:
-            # Gemini doesn't have native batch, process sequentially
-            embeddings = []
-            for text in texts:
-                if input_type == "query":
-                    emb = await self._get_gemini_client().generate_query_embedding(text)
-                else:
-                    emb = await self._get_gemini_client().generate_embedding(text)
-                embeddings.append(emb)
-            return embeddings
+            gemini_task_type = (
+                "retrieval_query" if input_type == "query" else "retrieval_document"
+            )
+            return await self._get_gemini_client().generate_embeddings(
+                texts, gemini_task_type
+            )
 
 
 @lru_cache
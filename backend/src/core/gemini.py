@@ -3,18 +3,132 @@
 Provides text embedding and generation capabilities using Google's Gemini API.
 """
 
+import asyncio
+import hashlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from functools import lru_cache
+from typing import TypeVar
 
 import google.generativeai as genai
+import numpy as np
 
 from src.core.config import settings
 
+T = TypeVar("T")
+
+# Upper bound on cached embeddings/answers; repeat queries and
+# re-ingested chunk texts hit memory instead of the API, and the bound
+# keeps the trade at memory-vs-latency rather than a leak
+_CACHE_MAX_ENTRIES = 10_000
+
+
+def _cache_key(*parts: str) -> bytes:
+    """Hash cache key parts into a compact digest.
+
+    BLAKE2 runs at a few GB/s, effectively free next to a network
+    call, and the 16-byte digest keeps keys small at any input size.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.digest()
+
+
+class _AsyncLRUCache:
+    """Bounded LRU cache that coalesces concurrent duplicate calls.
+
+    Entries are futures rather than values: N concurrent callers with
+    the same key trigger one upstream request and all await its
+    result. Failed calls are evicted so the next caller retries.
+    """
+
+    def __init__(self, maxsize: int = _CACHE_MAX_ENTRIES) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, asyncio.Future] = OrderedDict()
+
+    def peek(self, key: bytes) -> asyncio.Future | None:
+        """Return the (possibly pending) future for key, if cached."""
+        future = self._entries.get(key)
+        if future is not None:
+            self._entries.move_to_end(key)
+        return future
+
+    def create_pending(self, key: bytes) -> asyncio.Future:
+        """Register a pending future for key; the caller must settle it."""
+        future = asyncio.get_running_loop().create_future()
+        self._entries[key] = future
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return future
+
+    def fail_pending(self, key: bytes, future: asyncio.Future, exc: BaseException) -> None:
+        """Settle a pending future with exc and evict it so callers retry."""
+        self._entries.pop(key, None)
+        future.set_exception(exc)
+        future.exception()  # waiters re-raise; mark retrieved here
+
+    async def get_or_create(
+        self, key: bytes, supplier: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Return the cached value for key, computing it via supplier once."""
+        future = self.peek(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = self.create_pending(key)
+        try:
+            value = await supplier()
+        except BaseException as exc:
+            self.fail_pending(key, future, exc)
+            raise
+        future.set_result(value)
+        return value
+
+
+_embedding_cache = _AsyncLRUCache()
+_generation_cache = _AsyncLRUCache()
+
 
 @lru_cache
 def configure_gemini() -> None:
-    """Configure the Gemini API with the API key."""
+    """Configure the Gemini API with the API key.
+
+    Uses the grpc_asyncio transport so all async calls multiplex over a
+    single long-lived HTTP/2 channel instead of churning TCP+TLS
+    handshakes when many chapters or requests run concurrently. All
+    Gemini usage in this codebase goes through the *_async APIs, which
+    is what this transport serves.
+    """
     if settings.gemini_api_key:
-        genai.configure(api_key=settings.gemini_api_key)
+        genai.configure(
+            api_key=settings.gemini_api_key,
+            transport="grpc_asyncio",
+        )
+
+
+@lru_cache(maxsize=32)
+def _model_for(system_instruction: str | None) -> "genai.GenerativeModel":
+    """Get or build a GenerativeModel for a system instruction.
+
+    The RAG endpoint reuses a handful of system prompts, so caching by
+    instruction avoids reallocating SDK model and config state on
+    every chat turn.
+
+    Args:
+        system_instruction: Optional system instruction for the model.
+
+    Returns:
+        Configured GenerativeModel instance.
+    """
+    return genai.GenerativeModel(
+        model_name=settings.generation_model,
+        generation_config=genai.GenerationConfig(
+            temperature=settings.generation_temperature,
+        ),
+        system_instruction=system_instruction,
+    )
 
 
 class GeminiClient:
@@ -23,20 +137,12 @@ class GeminiClient:
     def __init__(self) -> None:
         """Initialize the Gemini client."""
         configure_gemini()
-        self._generation_model: genai.GenerativeModel | None = None
         self._embedding_model = settings.embedding_model
 
     @property
     def generation_model(self) -> genai.GenerativeModel:
-        """Get or create the generation model instance."""
-        if self._generation_model is None:
-            self._generation_model = genai.GenerativeModel(
-                model_name=settings.generation_model,
-                generation_config=genai.GenerationConfig(
-                    temperature=settings.generation_temperature,
-                ),
-            )
-        return self._generation_model
+        """Get the cached instruction-free generation model."""
+        return _model_for(None)
 
     async def generate_text(
         self,
@@ -52,50 +158,141 @@ class GeminiClient:
         Returns:
             Generated text response.
         """
-        model = self.generation_model
-        if system_instruction:
-            model = genai.GenerativeModel(
-                model_name=settings.generation_model,
-                generation_config=genai.GenerationConfig(
-                    temperature=settings.generation_temperature,
-                ),
-                system_instruction=system_instruction,
-            )
+        async def call() -> str:
+            model = _model_for(system_instruction)
+            response = await model.generate_content_async(prompt)
+            return response.text
 
-        response = await model.generate_content_async(prompt)
-        return response.text
+        # Only deterministic generation is cacheable; sampled output
+        # must not be replayed
+        if settings.generation_temperature != 0:
+            return await call()
 
-    async def generate_embedding(self, text: str) -> list[float]:
+        key = _cache_key(
+            "text", settings.generation_model, system_instruction or "", prompt
+        )
+        return await _generation_cache.get_or_create(key, call)
+
+    async def generate_embedding(self, text: str) -> np.ndarray:
         """Generate an embedding vector for the given text.
 
         Args:
             text: Text to embed.
 
         Returns:
-            Embedding vector as list of floats.
+            Embedding vector as a float32 numpy array.
         """
-        result = await genai.embed_content_async(
-            model=f"models/{self._embedding_model}",
-            content=text,
-            task_type="retrieval_document",
-        )
-        return result["embedding"]
+        return await self._embed_cached(text, "retrieval_document")
+
+    async def _embed_cached(self, text: str, task_type: str) -> np.ndarray:
+        """Embed one text, serving repeats from the process cache.
+
+        Repeat user queries and re-ingested chunk texts skip the API
+        round-trip, and concurrent duplicates coalesce into one call.
+
+        Args:
+            text: Text to embed.
+            task_type: Embedding task type.
+
+        Returns:
+            Embedding vector as a float32 numpy array.
+        """
+        async def call() -> np.ndarray:
+            result = await genai.embed_content_async(
+                model=f"models/{self._embedding_model}",
+                content=text,
+                task_type=task_type,
+            )
+            return np.asarray(result["embedding"], dtype=np.float32)
+
+        key = _cache_key("embed", self._embedding_model, task_type, text)
+        return await _embedding_cache.get_or_create(key, call)
 
-    async def generate_query_embedding(self, query: str) -> list[float]:
+    async def generate_embeddings(
+        self,
+        texts: list[str],
+        task_type: str = "retrieval_document",
+        batch_size: int = 100,
+    ) -> np.ndarray:
+        """Generate embeddings for multiple texts in batched requests.
+
+        Passing a list of contents returns one embedding per entry, so
+        N texts cost ceil(N / batch_size) round-trips instead of N
+        (the API accepts up to 100 contents per call). Input order is
+        preserved.
+
+        Args:
+            texts: Texts to embed.
+            task_type: Embedding task type (retrieval_document or
+                retrieval_query).
+            batch_size: Maximum contents per request.
+
+        Returns:
+            Float32 numpy array of shape (len(texts), dimension).
+        """
+        model = f"models/{self._embedding_model}"
+        vectors: list[np.ndarray | None] = [None] * len(texts)
+
+        # Partition against the process cache first: cached or
+        # in-flight texts never reach the API, and only the misses are
+        # batched. Misses register pending futures up front so
+        # concurrent duplicates coalesce onto this call
+        inflight: list[tuple[int, asyncio.Future]] = []
+        misses: list[tuple[int, bytes, asyncio.Future]] = []
+        for i, text in enumerate(texts):
+            key = _cache_key("embed", self._embedding_model, task_type, text)
+            future = _embedding_cache.peek(key)
+            if future is not None:
+                inflight.append((i, future))
+            else:
+                misses.append((i, key, _embedding_cache.create_pending(key)))
+
+        try:
+            for start in range(0, len(misses), batch_size):
+                batch = misses[start : start + batch_size]
+                try:
+                    result = await genai.embed_content_async(
+                        model=model,
+                        content=[texts[i] for i, _, _ in batch],
+                        task_type=task_type,
+                    )
+                    embeddings = result["embedding"]
+                except Exception:
+                    # Retry the batch one text at a time so a single
+                    # bad entry fails alone instead of taking its whole
+                    # batch down with it
+                    embeddings = []
+                    for i, _, _ in batch:
+                        result = await genai.embed_content_async(
+                            model=model, content=texts[i], task_type=task_type
+                        )
+                        embeddings.append(result["embedding"])
+                for (i, _, future), embedding in zip(batch, embeddings):
+                    value = np.asarray(embedding, dtype=np.float32)
+                    future.set_result(value)
+                    vectors[i] = value
+        except BaseException as exc:
+            # Settle and evict whatever this call still owes, so
+            # coalesced waiters see the failure and later calls retry
+            for _, key, future in misses:
+                if not future.done():
+                    _embedding_cache.fail_pending(key, future, exc)
+            raise
+
+        for i, future in inflight:
+            vectors[i] = await asyncio.shield(future)
+        return np.asarray(vectors, dtype=np.float32)
+
+    async def generate_query_embedding(self, query: str) -> np.ndarray:
         """Generate an embedding vector optimized for queries.
 
         Args:
             query: Query text to embed.
 
         Returns:
-            Embedding vector as list of floats.
+            Embedding vector as a float32 numpy array.
         """
-        result = await genai.embed_content_async(
-            model=f"models/{self._embedding_model}",
-            content=query,
-            task_type="retrieval_query",
-        )
-        return result["embedding"]
+        return await self._embed_cached(query, "retrieval_query")
 
 
 @lru_cache
@@ -3,26 +3,45 @@
 Provides a configured Qdrant client for vector similarity search operations.
 """
 
+import asyncio
+from collections.abc import Sequence
 from functools import lru_cache
 
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    Distance,
+    Filter,
+    PointStruct,
+    Prefetch,
+    QueryRequest,
+    ScoredPoint,
+    SearchParams,
+    VectorParams,
+)
 
 from src.core.config import settings
 
 
 @lru_cache
-def get_qdrant_client() -> QdrantClient:
-    """Get cached Qdrant client instance.
+def get_qdrant_client() -> AsyncQdrantClient:
+    """Get cached async Qdrant client instance.
+
+    The async client keeps Qdrant I/O off the event-loop thread, so
+    concurrent RAG queries overlap instead of serializing behind one
+    blocking call. Cloud connections reuse a sized connection pool
+    (and optionally gRPC) tuned via settings; local persistent storage
+    goes through the embedded async client.
 
     Returns:
-        QdrantClient: Configured Qdrant client.
+        AsyncQdrantClient: Configured Qdrant client.
     """
     # If cloud URL is provided, use cloud
     if settings.qdrant_url:
-        return QdrantClient(
+        return AsyncQdrantClient(
             url=settings.qdrant_url,
             api_key=settings.qdrant_api_key if settings.qdrant_api_key else None,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            pool_size=settings.qdrant_pool_size,
             timeout=30,
         )
 
@@ -30,11 +49,11 @@ def get_qdrant_client() -> QdrantClient:
     from pathlib import Path
     qdrant_path = Path(settings.qdrant_path)
     qdrant_path.mkdir(parents=True, exist_ok=True)
-    return QdrantClient(path=str(qdrant_path))
+    return AsyncQdrantClient(path=str(qdrant_path))
 
 
 async def ensure_collection_exists(
-    client: QdrantClient,
+    client: AsyncQdrantClient,
     collection_name: str | None = None,
     vector_size: int | None = None,
 ) -> None:
@@ -48,11 +67,11 @@ async def ensure_collection_exists(
     name = collection_name or settings.qdrant_collection
     size = vector_size if vector_size is not None else settings.embedding_dimension
 
-    collections = client.get_collections()
+    collections = await client.get_collections()
     existing_names = [c.name for c in collections.collections]
 
     if name not in existing_names:
-        client.create_collection(
+        await client.create_collection(
             collection_name=name,
             vectors_config=VectorParams(
                 size=size,
@@ -61,5 +80,148 @@ async def ensure_collection_exists(
         )
 
 
+async def query_with_prefetch(
+    client: AsyncQdrantClient,
+    dense_vector: Sequence[float],
+    collection_name: str | None = None,
+    limit: int = 5,
+    query_filter: Filter | None = None,
+    score_threshold: float | None = None,
+    hnsw_ef: int = 128,
+) -> list[ScoredPoint]:
+    """Search via query_points with a widened prefetch stage.
+
+    The prefetch stage pulls a larger candidate pool (4x the final
+    limit, at least 50) with the payload filter applied, and the outer
+    query re-scores those candidates against the dense vector — all in
+    one round trip. hnsw_ef widens the index search beam for better
+    recall on the candidate pass. Scores stay cosine similarities, so
+    callers' thresholds keep their meaning.
+
+    Args:
+        client: Qdrant client instance.
+        dense_vector: Query embedding.
+        collection_name: Target collection. Defaults to config value.
+        limit: Number of results to return.
+        query_filter: Optional indexed payload filter.
+        score_threshold: Minimum similarity score for results.
+        hnsw_ef: HNSW search beam width for the prefetch pass.
+
+    Returns:
+        Scored points, best match first.
+    """
+    name = collection_name or settings.qdrant_collection
+    vector = list(dense_vector)
+    response = await client.query_points(
+        collection_name=name,
+        prefetch=[
+            Prefetch(
+                query=vector,
+                filter=query_filter,
+                limit=max(limit * 4, 50),
+            )
+        ],
+        query=vector,
+        limit=limit,
+        score_threshold=score_threshold,
+        search_params=SearchParams(hnsw_ef=hnsw_ef),
+    )
+    return response.points
+
+
+async def batch_query(
+    client: AsyncQdrantClient,
+    vectors: Sequence[Sequence[float]],
+    collection_name: str | None = None,
+    limit: int = 5,
+    query_filter: Filter | None = None,
+    score_threshold: float | None = None,
+    batch_size: int = 32,
+) -> list[list[ScoredPoint]]:
+    """Run several vector queries as server-side batches.
+
+    N query variants (rewrites, HyDE drafts) cost one round trip per
+    batch instead of one per query, and a shared filter is parsed once
+    server-side. Batches are capped at 32 requests — large batches over
+    few segments degrade to single-threaded execution on older Qdrant
+    servers — and fired concurrently.
+
+    Args:
+        client: Qdrant client instance.
+        vectors: Query embeddings, one per variant.
+        collection_name: Target collection. Defaults to config value.
+        limit: Number of results per query.
+        query_filter: Optional payload filter shared by all queries.
+        score_threshold: Minimum similarity score for results.
+        batch_size: Maximum requests per batch call.
+
+    Returns:
+        One list of scored points per input vector, in input order.
+    """
+    name = collection_name or settings.qdrant_collection
+    requests = [
+        QueryRequest(
+            query=list(vector),
+            limit=limit,
+            filter=query_filter,
+            score_threshold=score_threshold,
+            with_payload=True,
+        )
+        for vector in vectors
+    ]
+    responses = await asyncio.gather(
+        *(
+            client.query_batch_points(
+                collection_name=name,
+                requests=requests[i:i + batch_size],
+            )
+            for i in range(0, len(requests), batch_size)
+        )
+    )
+    return [result.points for batch in responses for result in batch]
+
+
+async def upsert_points_batched(
+    client: AsyncQdrantClient,
+    points: Sequence[PointStruct],
+    collection_name: str | None = None,
+    batch_size: int | None = None,
+    max_concurrency: int | None = None,
+) -> int:
+    """Upsert points in concurrent, size-bounded batches.
+
+    Batching amortizes the network round-trip over many points, and a
+    semaphore keeps a couple of upload requests in flight so transfer
+    overlaps server-side processing. Uploads use wait=False to defer
+    indexing during bulk loads instead of re-optimizing per request.
+
+    Args:
+        client: Qdrant client instance.
+        points: Points to upsert.
+        collection_name: Target collection. Defaults to config value.
+        batch_size: Points per upsert request. Defaults to config value.
+        max_concurrency: Maximum in-flight uploads. Defaults to config value.
+
+    Returns:
+        Number of points upserted.
+    """
+    name = collection_name or settings.qdrant_collection
+    size = batch_size or settings.qdrant_upsert_batch_size
+    semaphore = asyncio.Semaphore(max_concurrency or settings.qdrant_upsert_concurrency)
+
+    async def upload(batch: Sequence[PointStruct]) -> None:
+        async with semaphore:
+            await client.upsert(
+                collection_name=name,
+                points=list(batch),
+                wait=False,
+            )
+
+    await asyncio.gather(
+        *(upload(points[i:i + size]) for i in range(0, len(points), size))
+    )
+    return len(points)
+
+
 # Singleton client instance
 qdrant_client = get_qdrant_client()
@@ -3,11 +3,13 @@
 Provides JWT token validation and user extraction for API endpoints.
 """
 
+from typing import Annotated
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_db, get_db_ro
 from src.models.user import User
 from src.services.auth_service import AuthService
 
@@ -101,6 +103,75 @@ async def get_current_user_optional(
     return await auth_service.get_user_by_id(user_id)
 
 
+async def get_current_user_id_optional(
+    user: User | None = Depends(get_current_user_optional),
+) -> str | None:
+    """Dependency returning just the current user's id, if any.
+
+    Handlers that only attribute records to a user take the id string
+    directly instead of repeating `user.id if user else None`; FastAPI's
+    dependency cache resolves the user once per request.
+
+    Args:
+        user: Optionally authenticated user.
+
+    Returns:
+        The user's id, or None if not authenticated.
+    """
+    return user.id if user else None
+
+
+async def _get_authed_session(
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> tuple[User, AsyncSession]:
+    """Resolve the authenticated user and session as one dependency.
+
+    The per-request dependency cache means the session here is the
+    same one get_current_user looked the user up on, so routers that
+    need both resolve a single dependency chain instead of two.
+
+    Args:
+        user: Current authenticated user.
+        db: Database session shared with the user lookup.
+
+    Returns:
+        Tuple of (user, session).
+    """
+    return user, db
+
+
+# Annotated alias for endpoints that need the authenticated user and a
+# session: `async def handler(ctx: AuthedSession)` then `user, db = ctx`
+AuthedSession = Annotated[tuple[User, AsyncSession], Depends(_get_authed_session)]
+
+
+async def _get_authed_session_ro(
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    db: AsyncSession = Depends(get_db_ro),
+) -> tuple[User, AsyncSession]:
+    """Read-only variant of _get_authed_session.
+
+    Uses get_db_ro so the request skips the trailing COMMIT; intended
+    for GET handlers whose services never write.
+
+    Args:
+        credentials: HTTP Bearer credentials from request.
+        db: Read-only database session.
+
+    Returns:
+        Tuple of (user, session).
+    """
+    user = await get_current_user(credentials, db)
+    return user, db
+
+
+# Read-only counterpart of AuthedSession for GET endpoints
+AuthedSessionRO = Annotated[
+    tuple[User, AsyncSession], Depends(_get_authed_session_ro)
+]
+
+
 async def require_verified_user(
     user: User = Depends(get_current_user),
 ) -> User:
@@ -7,7 +7,9 @@ import uuid
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text
+import orjson
+
+from sqlalchemy import DateTime, Enum, ForeignKey, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
@@ -35,7 +37,7 @@ class ChatSession(Base):
     id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=lambda: uuid.uuid4().hex,
     )
     user_id: Mapped[str | None] = mapped_column(
         String(36),
@@ -45,13 +47,13 @@ class ChatSession(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -85,7 +87,7 @@ class ChatMessage(Base):
     id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=lambda: uuid.uuid4().hex,
     )
     session_id: Mapped[str] = mapped_column(
         String(36),
@@ -105,6 +107,11 @@ class ChatMessage(Base):
         Text,  # JSON string of citations
         nullable=True,
     )
+    # Python-side microsecond default, deliberately not func.now():
+    # the user/assistant pair saved in one flush would share the
+    # transaction timestamp (second-precision on SQLite), and history
+    # ordering by created_at would no longer keep question before
+    # answer
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
         default=datetime.utcnow,
@@ -123,14 +130,21 @@ class ChatMessage(Base):
 
     @property
     def citations(self) -> list[dict] | None:
-        """Parse citations from JSON string."""
-        if not self.citations_json:
-            return None
-        import json
-        try:
-            return json.loads(self.citations_json)
-        except json.JSONDecodeError:
-            return None
+        """Parse citations from JSON once, memoized per instance.
+
+        History rendering touches this repeatedly per message; the
+        parsed value lands in the instance dict so the JSON is decoded
+        at most once per load.
+        """
+        if "_parsed_citations" not in self.__dict__:
+            parsed = None
+            if self.citations_json:
+                try:
+                    parsed = orjson.loads(self.citations_json)
+                except orjson.JSONDecodeError:
+                    parsed = None
+            self.__dict__["_parsed_citations"] = parsed
+        return self.__dict__["_parsed_citations"]
 
     @citations.setter
     def citations(self, value: list[dict] | None) -> None:
@@ -138,5 +152,5 @@ class ChatMessage(Base):
         if value is None:
             self.citations_json = None
         else:
-            import json
-            self.citations_json = json.dumps(value)
+            self.citations_json = orjson.dumps(value).decode("utf-8")
+        self.__dict__["_parsed_citations"] = value
@@ -7,7 +7,17 @@ import uuid
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
@@ -40,12 +50,15 @@ class ReadingProgress(Base):
     __tablename__ = "reading_progress"
     __table_args__ = (
         UniqueConstraint("user_id", "chapter_id", name="uq_user_chapter_progress"),
+        # Serves the "all progress for user, newest activity first"
+        # dashboard query without a sort step
+        Index("ix_progress_user_updated", "user_id", "updated_at"),
     )
 
     id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=lambda: uuid.uuid4().hex,
     )
     user_id: Mapped[str] = mapped_column(
         String(36),
@@ -89,8 +102,8 @@ class ReadingProgress(Base):
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -125,7 +138,7 @@ class Bookmark(Base):
     id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=lambda: uuid.uuid4().hex,
     )
     user_id: Mapped[str] = mapped_column(
         String(36),
@@ -158,7 +171,7 @@ class Bookmark(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False,
     )
 
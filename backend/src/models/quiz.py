@@ -7,7 +7,18 @@ import uuid
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
@@ -41,7 +52,7 @@ class Quiz(Base):
     id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=lambda: uuid.uuid4().hex,
     )
     chapter_id: Mapped[str] = mapped_column(
         String(50),
@@ -73,13 +84,13 @@ class Quiz(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -126,7 +137,7 @@ class Question(Base):
     id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=lambda: uuid.uuid4().hex,
     )
     quiz_id: Mapped[str] = mapped_column(
         String(36),
@@ -213,11 +224,16 @@ class QuizAttempt(Base):
     """
 
     __tablename__ = "quiz_attempts"
+    __table_args__ = (
+        # Serves the dashboard/history query "attempts for user, most
+        # recently completed first" without a sort step
+        Index("ix_attempt_user_completed", "user_id", "completed_at"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=lambda: uuid.uuid4().hex,
     )
     quiz_id: Mapped[str] = mapped_column(
         String(36),
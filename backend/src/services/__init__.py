@@ -1,7 +1,21 @@
 # Services package
+#
+# RAGService is exposed lazily (PEP 562): importing it pulls the Gemini
+# and Qdrant client modules, which the auth/progress/quiz paths never
+# need and which dominate cold-start time.
+from typing import Any
+
 from src.services.auth_service import AuthService
 from src.services.progress_service import ProgressService
 from src.services.quiz_service import QuizService
-from src.services.rag_service import RAGService
 
 __all__ = ["AuthService", "RAGService", "QuizService", "ProgressService"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve RAGService on first access instead of at import."""
+    if name == "RAGService":
+        from src.services.rag_service import RAGService
+
+        return RAGService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
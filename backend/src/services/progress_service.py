@@ -3,12 +3,14 @@
 Handles user learning progress, bookmarks, and personalized recommendations.
 """
 
+import asyncio
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.database import async_session_maker
 from src.models.progress import Bookmark, ProgressStatus, ReadingProgress
 from src.models.quiz import QuizAttempt
 
@@ -240,6 +242,82 @@ class ProgressService:
 
     # ==================== Dashboard & Recommendations ====================
 
+    @staticmethod
+    async def _fetch_all_progress(user_id: str) -> list[ReadingProgress]:
+        """Load a user's progress rows on a dedicated session."""
+        async with async_session_maker() as session:
+            return await ProgressService(session).get_all_progress(user_id)
+
+    @staticmethod
+    async def _fetch_bookmarks(user_id: str) -> list[Bookmark]:
+        """Load a user's bookmarks on a dedicated session."""
+        async with async_session_maker() as session:
+            return await ProgressService(session).get_bookmarks(user_id)
+
+    @staticmethod
+    async def _fetch_quiz_attempts(user_id: str) -> list[QuizAttempt]:
+        """Load a user's recent quiz attempts on a dedicated session."""
+        async with async_session_maker() as session:
+            result = await session.execute(
+                select(QuizAttempt)
+                .where(QuizAttempt.user_id == user_id)
+                .order_by(QuizAttempt.completed_at.desc())
+                .limit(10)
+            )
+            return list(result.scalars().all())
+
+    @staticmethod
+    async def _fetch_stats(user_id: str) -> dict[str, Any]:
+        """Aggregate dashboard stats in SQL on a dedicated session.
+
+        Counts, sums and the quiz-score average happen database-side
+        with aggregate FILTER clauses, so the stats never require
+        pulling a user's full history into Python. The existing
+        per-user indexes make each aggregate an index range scan.
+
+        Args:
+            user_id: User identifier.
+
+        Returns:
+            Dashboard stats dict.
+        """
+        async with async_session_maker() as session:
+            progress_row = (
+                await session.execute(
+                    select(
+                        func.count().filter(
+                            ReadingProgress.status == ProgressStatus.COMPLETED
+                        ),
+                        func.count().filter(
+                            ReadingProgress.status == ProgressStatus.IN_PROGRESS
+                        ),
+                        func.coalesce(func.sum(ReadingProgress.time_spent_seconds), 0),
+                    ).where(ReadingProgress.user_id == user_id)
+                )
+            ).one()
+            bookmark_count = (
+                await session.execute(
+                    select(func.count()).where(Bookmark.user_id == user_id)
+                )
+            ).scalar_one()
+            # avg() skips NULL scores (in-flight attempts) on its own
+            quiz_count, avg_quiz_score = (
+                await session.execute(
+                    select(func.count(), func.avg(QuizAttempt.score)).where(
+                        QuizAttempt.user_id == user_id
+                    )
+                )
+            ).one()
+
+        return {
+            "completed_chapters": progress_row[0],
+            "in_progress_chapters": progress_row[1],
+            "total_time_minutes": progress_row[2] // 60,
+            "total_bookmarks": bookmark_count,
+            "quizzes_taken": quiz_count,
+            "average_quiz_score": round(avg_quiz_score or 0.0, 1),
+        }
+
     async def get_dashboard_data(self, user_id: str) -> dict[str, Any]:
         """Get comprehensive dashboard data for a user.
 
@@ -249,36 +327,17 @@ class ProgressService:
         Returns:
             Dashboard data including progress, stats, and recommendations.
         """
-        # Get all progress
-        progress_list = await self.get_all_progress(user_id)
-
-        # Get bookmarks
-        bookmarks = await self.get_bookmarks(user_id)
-
-        # Get quiz history
-        quiz_result = await self.session.execute(
-            select(QuizAttempt)
-            .where(QuizAttempt.user_id == user_id)
-            .order_by(QuizAttempt.completed_at.desc())
-            .limit(10)
+        # The collection queries and the stats aggregates are
+        # independent, so each runs on its own session and they
+        # overlap; latency becomes the slowest query rather than the
+        # sum. One AsyncSession cannot execute concurrently, hence the
+        # dedicated sessions
+        progress_list, bookmarks, quiz_attempts, stats = await asyncio.gather(
+            self._fetch_all_progress(user_id),
+            self._fetch_bookmarks(user_id),
+            self._fetch_quiz_attempts(user_id),
+            self._fetch_stats(user_id),
         )
-        quiz_attempts = list(quiz_result.scalars().all())
-
-        # Calculate stats
-        completed_chapters = sum(
-            1 for p in progress_list if p.status == ProgressStatus.COMPLETED
-        )
-        in_progress_chapters = sum(
-            1 for p in progress_list if p.status == ProgressStatus.IN_PROGRESS
-        )
-        total_time_seconds = sum(p.time_spent_seconds for p in progress_list)
-
-        # Calculate average quiz score
-        avg_quiz_score = 0.0
-        completed_quizzes = [a for a in quiz_attempts if a.score is not None]
-        if completed_quizzes:
-            scores = [a.score for a in completed_quizzes if a.score is not None]
-            avg_quiz_score = sum(scores) / len(scores) if scores else 0.0
 
         # Generate recommendations
         recommendations = await self._generate_recommendations(
@@ -320,17 +379,33 @@ class ProgressService:
                 }
                 for a in quiz_attempts
             ],
-            "stats": {
-                "completed_chapters": completed_chapters,
-                "in_progress_chapters": in_progress_chapters,
-                "total_time_minutes": total_time_seconds // 60,
-                "total_bookmarks": len(bookmarks),
-                "quizzes_taken": len(quiz_attempts),
-                "average_quiz_score": round(avg_quiz_score, 1),
-            },
+            "stats": stats,
             "recommendations": recommendations,
         }
 
+    async def get_recommendations(self, user_id: str) -> list[dict[str, Any]]:
+        """Get personalized recommendations without full dashboard data.
+
+        Fetches only the progress and quiz-attempt rows the
+        recommendation logic needs, skipping the bookmark query and the
+        dict assembly that get_dashboard_data does for the rest of the
+        dashboard.
+
+        Args:
+            user_id: User identifier.
+
+        Returns:
+            List of recommendation objects.
+        """
+        progress_list, quiz_attempts = await asyncio.gather(
+            self._fetch_all_progress(user_id),
+            self._fetch_quiz_attempts(user_id),
+        )
+
+        return await self._generate_recommendations(
+            user_id, progress_list, quiz_attempts
+        )
+
     async def _generate_recommendations(
         self,
         user_id: str,
@@ -425,12 +500,16 @@ class ProgressService:
         Returns:
             Completion statistics.
         """
-        progress_list = await self.get_all_progress(user_id)
-
         total_chapters = 3  # Hardcoded for now
-        completed = sum(
-            1 for p in progress_list if p.status == ProgressStatus.COMPLETED
-        )
+        # Count database-side instead of loading every progress row
+        completed = (
+            await self.session.execute(
+                select(func.count()).where(
+                    ReadingProgress.user_id == user_id,
+                    ReadingProgress.status == ProgressStatus.COMPLETED,
+                )
+            )
+        ).scalar_one()
 
         return {
             "total_chapters": total_chapters,
@@ -158,6 +158,32 @@ class QuizService:
 
         return None
 
+    @staticmethod
+    def _summary_from_db(quiz: Quiz) -> QuizSummary:
+        """Build a QuizSummary from a database quiz with loaded questions."""
+        return QuizSummary(
+            id=quiz.id,
+            chapter_id=quiz.chapter_id,
+            title=quiz.title,
+            description=quiz.description,
+            question_count=len(quiz.questions),
+            passing_score=quiz.passing_score,
+            time_limit_minutes=quiz.time_limit_minutes,
+        )
+
+    @staticmethod
+    def _summary_from_file(chapter_id: str, quiz_data: dict) -> QuizSummary:
+        """Build a QuizSummary from file-based quiz data."""
+        return QuizSummary(
+            id=quiz_data.get("id", f"quiz-{chapter_id}"),
+            chapter_id=chapter_id,
+            title=quiz_data.get("title", f"Quiz: {chapter_id}"),
+            description=quiz_data.get("description"),
+            question_count=len(quiz_data.get("questions", [])),
+            passing_score=70,
+            time_limit_minutes=None,
+        )
+
     async def get_quiz_for_chapter(self, chapter_id: str) -> QuizSummary | None:
         """Get quiz summary for a chapter.
 
@@ -177,31 +203,82 @@ class QuizService:
         quiz = result.scalar_one_or_none()
 
         if quiz:
-            return QuizSummary(
-                id=quiz.id,
-                chapter_id=quiz.chapter_id,
-                title=quiz.title,
-                description=quiz.description,
-                question_count=len(quiz.questions),
-                passing_score=quiz.passing_score,
-                time_limit_minutes=quiz.time_limit_minutes,
-            )
+            return self._summary_from_db(quiz)
 
         # Fall back to file-based quiz
         quiz_data = await self.load_quiz_from_file(chapter_id)
         if quiz_data:
-            return QuizSummary(
-                id=quiz_data.get("id", f"quiz-{chapter_id}"),
-                chapter_id=chapter_id,
-                title=quiz_data.get("title", f"Quiz: {chapter_id}"),
-                description=quiz_data.get("description"),
-                question_count=len(quiz_data.get("questions", [])),
-                passing_score=70,
-                time_limit_minutes=None,
-            )
+            return self._summary_from_file(chapter_id, quiz_data)
 
         return None
 
+    async def get_quizzes_for_chapters(
+        self,
+        chapter_ids: list[str],
+    ) -> dict[str, QuizSummary]:
+        """Get quiz summaries for several chapters in one query.
+
+        A single SELECT with an IN clause replaces one round trip per
+        chapter; chapters without a database quiz fall back to
+        file-based quizzes as in get_quiz_for_chapter.
+
+        Args:
+            chapter_ids: Chapter identifiers to look up
+
+        Returns:
+            Dict mapping chapter_id to QuizSummary for chapters that
+            have a quiz
+        """
+        result = await self.db.execute(
+            select(Quiz)
+            .where(Quiz.chapter_id.in_(chapter_ids))
+            .where(Quiz.is_active.is_(True))
+            .options(selectinload(Quiz.questions))
+        )
+        summaries = {
+            quiz.chapter_id: self._summary_from_db(quiz)
+            for quiz in result.scalars().all()
+        }
+
+        for chapter_id in chapter_ids:
+            if chapter_id in summaries:
+                continue
+            quiz_data = await self.load_quiz_from_file(chapter_id)
+            if quiz_data:
+                summaries[chapter_id] = self._summary_from_file(chapter_id, quiz_data)
+
+        return summaries
+
+    @staticmethod
+    def _questions_from_db(quiz: Quiz) -> list[QuestionData]:
+        """Build display questions from a database quiz with loaded questions."""
+        return [
+            QuestionData(
+                id=q.id,
+                question_type=q.question_type.value if isinstance(q.question_type, QuestionType) else q.question_type,
+                question_text=q.question_text,
+                options=q.options,
+                points=q.points,
+                order=q.order,
+            )
+            for q in sorted(quiz.questions, key=lambda x: x.order)
+        ]
+
+    @staticmethod
+    def _questions_from_file(quiz_data: dict) -> list[QuestionData]:
+        """Build display questions from file-based quiz data."""
+        return [
+            QuestionData(
+                id=q.get("id", str(i)),
+                question_type=q.get("type", "multiple_choice"),
+                question_text=q.get("question", ""),
+                options=q.get("options"),
+                points=q.get("points", 1),
+                order=q.get("order", i),
+            )
+            for i, q in enumerate(quiz_data.get("questions", []))
+        ]
+
     async def get_quiz_questions(self, chapter_id: str) -> list[QuestionData]:
         """Get quiz questions for display (without correct answers).
 
@@ -221,35 +298,51 @@ class QuizService:
         quiz = result.scalar_one_or_none()
 
         if quiz:
-            return [
-                QuestionData(
-                    id=q.id,
-                    question_type=q.question_type.value if isinstance(q.question_type, QuestionType) else q.question_type,
-                    question_text=q.question_text,
-                    options=q.options,
-                    points=q.points,
-                    order=q.order,
-                )
-                for q in sorted(quiz.questions, key=lambda x: x.order)
-            ]
+            return self._questions_from_db(quiz)
 
         # Fall back to file-based quiz
         quiz_data = await self.load_quiz_from_file(chapter_id)
         if quiz_data:
-            return [
-                QuestionData(
-                    id=q.get("id", str(i)),
-                    question_type=q.get("type", "multiple_choice"),
-                    question_text=q.get("question", ""),
-                    options=q.get("options"),
-                    points=q.get("points", 1),
-                    order=q.get("order", i),
-                )
-                for i, q in enumerate(quiz_data.get("questions", []))
-            ]
+            return self._questions_from_file(quiz_data)
 
         return []
 
+    async def get_quiz_with_questions(
+        self,
+        chapter_id: str,
+    ) -> tuple[QuizSummary, list[QuestionData]] | None:
+        """Get a chapter's quiz summary and display questions together.
+
+        One eager-loaded query serves both, instead of the separate
+        get_quiz_for_chapter + get_quiz_questions round trips.
+
+        Args:
+            chapter_id: Chapter identifier
+
+        Returns:
+            Tuple of (QuizSummary, questions), or None if no quiz
+            exists for the chapter
+        """
+        result = await self.db.execute(
+            select(Quiz)
+            .where(Quiz.chapter_id == chapter_id)
+            .where(Quiz.is_active.is_(True))
+            .options(selectinload(Quiz.questions))
+        )
+        quiz = result.scalar_one_or_none()
+
+        if quiz:
+            return self._summary_from_db(quiz), self._questions_from_db(quiz)
+
+        quiz_data = await self.load_quiz_from_file(chapter_id)
+        if quiz_data:
+            return (
+                self._summary_from_file(chapter_id, quiz_data),
+                self._questions_from_file(quiz_data),
+            )
+
+        return None
+
     async def start_attempt(
         self,
         chapter_id: str,
@@ -4,17 +4,18 @@ Provides question answering with citations from textbook content.
 Supports multiple embedding providers (Cohere, Gemini) via unified embedding service.
 """
 
-import json
 from dataclasses import dataclass
 
-from qdrant_client import QdrantClient
+import orjson
+
+from qdrant_client import AsyncQdrantClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
 from src.core.embeddings import embedding_service
 from src.core.gemini import gemini_client
-from src.core.qdrant import qdrant_client
+from src.core.qdrant import qdrant_client, query_with_prefetch
 from src.models.chat import ChatMessage, ChatSession, MessageRole
 
 
@@ -80,7 +81,7 @@ class RAGService:
     def __init__(
         self,
         db: AsyncSession,
-        qdrant: QdrantClient | None = None,
+        qdrant: AsyncQdrantClient | None = None,
     ):
         """Initialize RAG service.
 
@@ -144,13 +145,16 @@ class RAGService:
                     must=[FieldCondition(key="language", match=MatchValue(value=language))]
                 )
 
-            results = self.qdrant.query_points(
+            results = await query_with_prefetch(
+                self.qdrant,
+                # The embedding stays a float32 ndarray until this
+                # serialization boundary
+                query_embedding.tolist(),
                 collection_name=self.collection_name,
-                query=query_embedding,
-                query_filter=query_filter,
                 limit=self.top_k,
+                query_filter=query_filter,
                 score_threshold=0.5,  # Minimum relevance threshold
-            ).points
+            )
         except Exception as e:
             import traceback
             print(f"Qdrant search error: {e}")
@@ -347,7 +351,11 @@ Please answer the question based on the context provided. If the context doesn't
             session_id=session_id,
             role=MessageRole.ASSISTANT,
             content=response.answer,
-            citations_json=json.dumps(citations_data) if citations_data else None,
+            citations_json=(
+                orjson.dumps(citations_data).decode("utf-8")
+                if citations_data
+                else None
+            ),
         )
         self.db.add(assistant_message)
 
@@ -356,23 +364,32 @@ Please answer the question based on the context provided. If the context doesn't
     async def get_session_history(
         self,
         session_id: str,
-    ) -> list[dict]:
+    ) -> tuple[bool, list[dict]]:
         """Get chat history for a session.
 
+        An outer join against the session row answers "does the session
+        exist" and "what are its messages" in one round trip, so an
+        empty-but-valid session doesn't need a follow-up existence
+        query.
+
         Args:
             session_id: Chat session ID.
 
         Returns:
-            List of message dictionaries.
+            Tuple of (session exists, list of message dictionaries).
         """
         result = await self.db.execute(
-            select(ChatMessage)
-            .where(ChatMessage.session_id == session_id)
+            select(ChatSession.id, ChatMessage)
+            .outerjoin(ChatMessage, ChatMessage.session_id == ChatSession.id)
+            .where(ChatSession.id == session_id)
             .order_by(ChatMessage.created_at)
         )
-        messages = result.scalars().all()
+        rows = result.all()
+
+        if not rows:
+            return False, []
 
-        return [
+        return True, [
             {
                 "id": msg.id,
                 "role": msg.role.value if hasattr(msg.role, "value") else msg.role,
@@ -380,7 +397,8 @@ Please answer the question based on the context provided. If the context doesn't
                 "citations": msg.citations,
                 "created_at": msg.created_at.isoformat(),
             }
-            for msg in messages
+            for _, msg in rows
+            if msg is not None
         ]
 
     async def create_session(self, user_id: str | None = None) -> ChatSession: